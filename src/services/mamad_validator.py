@@ -14,13 +14,180 @@ Validates:
 """
 
 import structlog
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, FrozenSet, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 import re
 
 logger = structlog.get_logger(__name__)
 
+# Unit spellings accepted for room volume (2.2) and metric lengths (1.4).
+_VOLUME_UNITS = frozenset({"m3", "m^3", "m³", "מ\"ק"})
+_METER_UNITS = frozenset({"m", "meter", "meters"})
+
+# Structural element type labels emitted by the extractor (English + Hebrew).
+_WALL_TYPES = frozenset({"wall", "קיר", "קיר חיצוני"})
+_DOOR_TYPES = frozenset({"door", "דלת", "דלת הדף"})
+_WINDOW_TYPES = frozenset({"window", "חלון", "חלון הדף"})
+
+# Door-spacing unit aliases -> (multiplier, divisor) to centimeters. Unknown/missing units are cm.
+_UNIT_TO_CM: Dict[str, Tuple[float, float]] = {
+    **dict.fromkeys(["m", "meter", "meters", "מ", "מטר"], (100.0, 1.0)),
+    **dict.fromkeys(["mm", "millimeter", "millimeters", "מ\"מ", "ממ"], (1.0, 10.0)),
+}
+
+# Separators between categories in a multi-category classification string.
+_CATEGORY_SPLIT_RE = re.compile(r"[|,]")
+
+# Rule 1.2 minimum wall thickness (cm), indexed [has_window][external wall count - 1].
+_REQUIRED_WALL_THICKNESS_CM: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+    (25, 25, 30, 40),
+    (30, 30, 30, 40),
+)
+
+# Explicit wall exposure markers for rule 1.2 (already lower-case).
+_WALL_EXTERNAL_MARKERS = (
+    "קיר חיצוני",
+    "חיצוני",
+    "external",
+    "outside",
+    "exterior",
+    "חזית",
+    "מעטפת",
+    "היקפי",
+    "perimeter",
+    "cyan perimeter",
+    "outer band",
+    "outer wall",
+)
+_WALL_INTERNAL_MARKERS = (
+    "קיר פנימי",
+    "פנימי",
+    "internal",
+    "inside",
+    "partition",
+    "adjacent",
+    "אזור פנימי",
+    "חלל פנימי",
+)
+_WALL_EXTERNAL_RE = re.compile("|".join(re.escape(m) for m in _WALL_EXTERNAL_MARKERS))
+_WALL_INTERNAL_RE = re.compile("|".join(re.escape(m) for m in _WALL_INTERNAL_MARKERS))
+
+# Wall-side hints in free-form locations/notes (1.2, lower-cased). Be conservative with
+# top/bottom: OCR locations often say "top"/"bottom" about drawing placement, so only
+# accept them when explicitly tied to a wall/side direction.
+_WALL_SIDE_MARKERS = (
+    ("left", ("שמאל", "צד שמאל", "קיר שמאל", "שמאלה", "left", "west")),
+    ("right", ("ימין", "צד ימין", "קיר ימין", "ימינה", "right", "east")),
+    ("top", (
+        "עליון", "למעלה", "צד עליון", "קיר עליון", "צפון",
+        "north wall", "wall north", "top wall", "wall top", "top side", "upper wall",
+    )),
+    ("bottom", (
+        "תחתון", "למטה", "צד תחתון", "קיר תחתון", "דרום",
+        "south wall", "wall south", "bottom wall", "wall bottom", "bottom side", "lower wall",
+    )),
+)
+_WALL_SIDE_RES = tuple(
+    (side, re.compile("|".join(re.escape(m) for m in markers))) for side, markers in _WALL_SIDE_MARKERS
+)
+
+# Door/window element wording used by the 1.2 door=>internal / window=>external inference.
+_MAMAD_DOOR_MARKERS = ("ממ\"ד", "ממד", "ד.ה", "דלת הדף", "דלת ממ\"ד", "משוריינת", "ממ")
+_BLAST_WINDOW_MARKERS = ("חלון הדף", "הדף", "ת\"י 4422", "4422", "ממ\"ד", "ממד", "blast")
+_SLIDING_WINDOW_MARKERS = ("נגרר", "נגררת", "נגררים", "נישת גרירה", "גרירה", "sliding", "pocket")
+_WINDOW_EXTERNAL_MARKERS = (
+    "קיר חיצוני", "חיצוני", "external", "outside", "exterior", "חזית", "מעטפת", "perimeter", "outer",
+)
+_MAMAD_DOOR_RE = re.compile("|".join(re.escape(m) for m in _MAMAD_DOOR_MARKERS))
+_BLAST_WINDOW_RE = re.compile("|".join(re.escape(m) for m in _BLAST_WINDOW_MARKERS))
+_SLIDING_WINDOW_RE = re.compile("|".join(re.escape(m) for m in _SLIDING_WINDOW_MARKERS))
+_WINDOW_EXTERNAL_RE = re.compile("|".join(re.escape(m) for m in _WINDOW_EXTERNAL_MARKERS))
+
+# Wording that ties a metric dimension to a wall height / concrete-to-concrete opening (1.4).
+_HIGH_WALL_KEYS_RE = re.compile(
+    "|".join(re.escape(k) for k in ["בטון", "beton", "concrete", "קיר", "wall", "בטון-לבטון", "clear", "מפתח"])
+)
+
+# OCR mixes Hebrew gershayim/geresh with ASCII quotes (ס״מ vs ס"מ, מ׳ vs מ'). Joined segment
+# text is normalized to the ASCII forms so the predicates below only spell each unit once.
+_HEBREW_QUOTES_TO_ASCII = str.maketrans({"״": '"', "׳": "'"})
+
+# Text predicates shared by the segment validators, compiled once at import.
+_SCALE_1_50_RE = re.compile(r"\b1\s*[:/]\s*50\b")
+_VOLUME_IN_LABEL_RE = re.compile(r"(?<!\d)(\d{1,3}(?:\.\d+)?)\s*(?:m3|m\^3|m³|מ\"ק)\b", flags=re.IGNORECASE)
+_VOLUME_IN_TEXT_RE = re.compile(r"(?i)(?:נפח|volume|v\s*=)\s*[:=]?\s*(\d{1,3}(?:\.\d+)?)\s*(?:m3|m\^3|m³|מ\"ק)")
+_NEAR_EXTERIOR_2M_RE = re.compile(r"(?<!\d)2\s*(?:m|מ')\b")
+_PROTECTIVE_WALL_20CM_RE = re.compile(r"(?<!\d)20\s*(?:cm|ס\"מ)\b")
+_CONTINUITY_PCT_RE = re.compile(r"(?i)(?:רציפות|continuity)\s*[:=]?\s*(\d{1,3}(?:\.\d+)?)\s*%")
+_CONTINUITY_PCT_NEAR_RE = re.compile(r"(?i)(?:רציפות|continuity)[^\n%]{0,40}(\d{1,3}(?:\.\d+)?)\s*%")
+# Door / opening wording, matched against lower-cased dimension labels and texts.
+_DOOR_MARKERS = ("door", "jamb", "frame", "דלת", "משקוף")
+_OPENING_MARKERS = ("door", "window", "opening", "jamb", "דלת", "חלון", "פתח", "משקוף")
+_DOOR_SPACING_ELEMENT_MARKERS = ("door", "jamb", "spacing", "clearance", "distance", "מרחק")
+_DOOR_MARKER_RE = re.compile("|".join(re.escape(m) for m in _DOOR_MARKERS))
+_OPENING_MARKER_RE = re.compile("|".join(re.escape(m) for m in _OPENING_MARKERS))
+_DOOR_SPACING_ELEMENT_RE = re.compile("|".join(re.escape(m) for m in _DOOR_SPACING_ELEMENT_MARKERS))
+# Explicit-unit window spacing callouts (3.2); the unit avoids matching "200" as "20".
+# Above this many windows, an inconclusive 3.2 focus extraction is reported once per segment.
+_WINDOW_SPACING_MAX_PER_WINDOW_EVALUATIONS = 3
+_WIN_SPACING_RE = re.compile(r"(?<!\d)(?:20|100)(?:\.0)?\s*(?:cm|ס\"מ)\b", flags=re.IGNORECASE)
+_CONCRETE_GRADE_RE = re.compile(r"(?:b|ב)\s*[-]?\s*(\d+)", flags=re.IGNORECASE)
+# Unit tokens stripped by _extract_dimension_value ("cm" first so its "m" is taken with it).
+_DIMENSION_UNIT_RE = re.compile(r"cm|ס\"מ|מ'|m")
+_DIMENSION_NUMBER_RE = re.compile(r"\d+\.?\d*")
+
+# Interior room-dimension wording for the minimum-area rule (2.3, lower-cased labels).
+_ROOM_DIM_INCLUDE_MARKERS = (
+    "ממ\"ד", "ממד", "ממ״ד", "mamad", "room", "חדר", "אורך", "רוחב",
+    "length", "width", "מידות", "dimensions", "פנימי",
+)
+_ROOM_DIM_EXCLUDE_MARKERS = (
+    "עובי", "thickness", "door", "window", "פתח", "גובה", "height", "סף", "משקוף", "משקופים",
+)
+_OVERALL_DIM_MARKERS = ("overall", "כולל", "חוץ", "external", "ברוטו", "gross", "outer")
+_ROOM_DIM_INCLUDE_RE = re.compile("|".join(re.escape(m) for m in _ROOM_DIM_INCLUDE_MARKERS))
+_ROOM_DIM_EXCLUDE_RE = re.compile("|".join(re.escape(m) for m in _ROOM_DIM_EXCLUDE_MARKERS))
+_OVERALL_DIM_RE = re.compile("|".join(re.escape(m) for m in _OVERALL_DIM_MARKERS))
+_REBAR_EXTERNAL_RE = re.compile(r"חיצוני|external", flags=re.IGNORECASE)
+_REBAR_INTERNAL_RE = re.compile(r"פנימי|internal", flags=re.IGNORECASE)
+_CONCRETE_TYPE_MARKERS = ("בטון", "concrete")
+_STEEL_TYPE_MARKERS = ("פלדה", "steel")
+_STEEL_COLD_DRAWN_RE = re.compile(r"משוכה בקור|cold[- ]drawn", flags=re.IGNORECASE)
+_STEEL_ALLOWED_RE = re.compile(r"מעוגלת בחום|רתיך|hot[- ]rolled|welded", flags=re.IGNORECASE)
+
+
+def _as_text(value: Any) -> str:
+    """Equivalent of `str(value or "")` that returns strings unchanged."""
+    return value if isinstance(value, str) else str(value or "")
+
+
+def _primary_category(classification: Dict[str, Any]) -> str:
+    """First upper-cased primary category (secondary labels are often noisy on mixed crops)."""
+    raw = classification.get("primary_category", "")
+    if isinstance(raw, str):
+        raw = raw.strip()
+        return _CATEGORY_SPLIT_RE.split(raw, 1)[0].strip().upper() if raw else ""
+    if isinstance(raw, list) and raw:
+        return str(raw[0]).strip().upper()
+    return ""
+
+
+def _materials_of_kind(materials: Any, markers: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Material dicts whose lowered `type` contains any of `markers`."""
+    matched: List[Dict[str, Any]] = []
+    for m in materials:
+        if not isinstance(m, dict):
+            continue
+        type_lower = str(m.get("type", "")).lower()
+        for marker in markers:
+            if marker in type_lower:
+                matched.append(m)
+                break
+    return matched
+
 
 class ViolationSeverity(str, Enum):
     """Severity levels for violations"""
@@ -41,14 +208,190 @@ class Violation:
     location: str = ""  # Where in the plan
 
 
+# Legacy violation metadata per requirement, used when mirroring failed evaluations.
+_SEVERITY_BY_REQ: Dict[str, ViolationSeverity] = {
+    "1.2": ViolationSeverity.CRITICAL,
+    "2.1": ViolationSeverity.CRITICAL,
+    "2.2": ViolationSeverity.WARNING,
+    "2.3": ViolationSeverity.CRITICAL,
+    "3.1": ViolationSeverity.WARNING,
+    "3.2": ViolationSeverity.WARNING,
+    "4.2": ViolationSeverity.WARNING,
+    "6.1": ViolationSeverity.WARNING,
+    "6.2": ViolationSeverity.CRITICAL,
+    "6.3": ViolationSeverity.CRITICAL,
+}
+
+_CATEGORY_BY_REQ: Dict[str, str] = {
+    "1.2": "קירות",
+    "2.1": "גובה",
+    "2.2": "גובה",
+    "2.3": "שטח",
+    "3.1": "דלת",
+    "3.2": "חלון",
+    "4.2": "אוורור",
+    "6.1": "בטון",
+    "6.2": "פלדה",
+    "6.3": "זיון",
+}
+
+_REQUIREMENT_TEXT_BY_REQ: Dict[str, str] = {
+    "1.2": "עובי קיר - 25-40 ס\"מ לפי מספר קירות חיצוניים",
+    "2.1": "גובה מינימלי 2.50 מטר",
+    "2.2": "גובה 2.20 מטר במרתף/תוספת בניה (עם נפח ≥22.5 מ\"ק)",
+    "2.3": "שטח ממ\"ד נטו מינימלי 9 מ\"ר (ללא קירות)",
+    "3.1": "ריווח דלת - ≥90cm מבפנים, ≥75cm מבחוץ",
+    "3.2": "ריווח חלון - ≥20cm בין נישות, ≥100cm בין פתחי אור",
+    "4.2": 'הערת אוורור וסינון בהתאם לת"י 4570',
+    "6.1": "דרגת בטון ב-30 לפחות",
+    "6.2": "פלדה מעוגלת בחום או רתיך בלבד (לא משוכה בקור)",
+    "6.3": "פסיעת זיון: חיצוני ≤20 ס\"מ, פנימי ≤10 ס\"מ",
+}
+
+# Evaluation statuses that count a requirement as actually checked.
+_TERMINAL_STATUSES = frozenset({"passed", "failed"})
+
+# Map categories to validation functions (MamadValidator method names).
+_VALIDATORS_BY_CATEGORY: Dict[str, Tuple[str, ...]] = {
+    "WALL_SECTION": ("_validate_wall_thickness",),
+    "ROOM_LAYOUT": (
+        "_validate_room_height",
+        "_validate_mamad_min_area",
+        "_validate_external_wall_count",
+        "_validate_external_wall_classification",
+        "_validate_tower_continuity",
+    ),
+    "DOOR_DETAILS": ("_validate_door_spacing",),
+    "WINDOW_DETAILS": ("_validate_window_spacing",),
+    "REBAR_DETAILS": ("_validate_rebar_specifications",),
+    "MATERIALS_SPECS": ("_validate_concrete_grade", "_validate_steel_type"),
+    "GENERAL_NOTES": ("_validate_ventilation_note",),
+    "SECTIONS": ("_validate_room_height", "_validate_high_wall"),
+}
+
+# Which official requirement IDs each validator corresponds to.
+# IMPORTANT: We only count a requirement as "checked" if the validator actually
+# had enough evidence to evaluate it (or emitted a missing-info violation).
+_VALIDATOR_REQUIREMENTS: Dict[str, FrozenSet[str]] = {
+    "_validate_wall_thickness": frozenset({"1.2"}),
+    "_validate_room_height": frozenset({"2.1", "2.2"}),
+    "_validate_mamad_min_area": frozenset({"2.3"}),
+    "_validate_external_wall_count": frozenset({"1.1"}),
+    "_validate_external_wall_classification": frozenset({"1.3"}),
+    "_validate_high_wall": frozenset({"1.4"}),
+    "_validate_tower_continuity": frozenset({"1.5"}),
+    "_validate_door_spacing": frozenset({"3.1"}),
+    "_validate_window_spacing": frozenset({"3.2"}),
+    "_validate_rebar_specifications": frozenset({"6.3"}),
+    "_validate_concrete_grade": frozenset({"6.1"}),
+    "_validate_steel_type": frozenset({"6.2"}),
+    "_validate_ventilation_note": frozenset({"4.2"}),
+}
+
+
+@lru_cache(maxsize=256)
+def _plan_validators(
+    categories: Tuple[str, ...],
+    enabled_requirements: Optional[FrozenSet[str]],
+    skip_requirements: FrozenSet[str],
+) -> Tuple[Tuple[str, ...], FrozenSet[str], FrozenSet[str]]:
+    """Plan the validators for a segment's categories.
+
+    Returns (validator names in run order, planned requirement IDs, requirement IDs skipped
+    because they already passed in another segment). Pure in its arguments, so the plan is
+    shared by every segment with the same categories and requirement selection.
+    """
+    validators: List[str] = []
+    planned: set[str] = set()
+    skipped: set[str] = set()
+    # A validator shared by several categories (or a repeated category) is planned once.
+    for fn in dict.fromkeys(fn for cat in categories for fn in _VALIDATORS_BY_CATEGORY.get(cat, ())):
+        # If user selected a subset of requirements, only allow validators that map
+        # to at least one enabled requirement.
+        mapped_all = _VALIDATOR_REQUIREMENTS.get(fn, frozenset())
+
+        # Track requirements that would have been planned but are skipped due to
+        # already passing in other segments.
+        already_passed = mapped_all & skip_requirements
+        mapped_effective = mapped_all - skip_requirements
+        if enabled_requirements is not None:
+            already_passed &= enabled_requirements
+            mapped_effective &= enabled_requirements
+        skipped |= already_passed
+
+        # If all requirements for this validator are skipped/disabled, do not run it.
+        if mapped_all and not mapped_effective:
+            continue
+
+        validators.append(fn)
+        planned |= mapped_effective
+    return tuple(validators), frozenset(planned), frozenset(skipped)
+
+
 class MamadValidator:
     """Validates MAMAD architectural plans against requirements"""
+
+    __slots__ = (
+        "violations",
+        "requirement_evaluations",
+        "_skip_requirements",
+        "_skip_emitted",
+        "_segment_cache",
+        "_door_required_evidence",
+        "_window_required_evidence",
+        "_rebar_required_evidence",
+        "_height_required_evidence",
+        "_height_exception_required_evidence",
+        "_volume_required_evidence",
+    )
     
     def __init__(self):
         self.violations: List[Violation] = []
         self.requirement_evaluations: List[Dict[str, Any]] = []
         # Per-run skip list (e.g., requirements already passed in earlier segments)
         self._skip_requirements: set[str] = set()
+        # Skipped requirements that already received their single not_checked evaluation.
+        self._skip_emitted: set[str] = set()
+        # Per-run cache of the joined segment text read by several rules; cleared after each run.
+        self._segment_cache: Dict[str, Any] = {}
+
+        # Threshold evidence appended to every 2.1 / 2.2 / 3.1 / 3.2 / 6.3 verdict. Built once and shared
+        # (read-only) across evaluations.
+        self._door_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=90.0, unit="cm", element="required_internal_min"),
+            self._evidence_dimension(value=75.0, unit="cm", element="required_external_min"),
+        ]
+        self._window_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=20.0, unit="cm", element="required_min_niche_or_wall"),
+            self._evidence_dimension(value=100.0, unit="cm", element="required_min_light_openings"),
+            self._evidence_dimension(value=20.0, unit="cm", element="required_min_window_to_wall"),
+        ]
+        self._rebar_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=20.0, unit="cm", element="required_external_max"),
+            self._evidence_dimension(value=10.0, unit="cm", element="required_internal_max"),
+        ]
+        self._height_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=2.50, unit="m", element="required_min_height"),
+        ]
+        self._height_exception_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=2.20, unit="m", element="required_exception_min_height"),
+        ]
+        self._volume_required_evidence: List[Dict[str, Any]] = [
+            self._evidence_dimension(value=22.5, unit="m3", element="required_min_volume"),
+        ]
+
+    def _segment_feature(self, data: Dict[str, Any], key: str, compute: Callable[[], Any]) -> Any:
+        """Return a feature derived from `data`, computing it at most once per segment run.
+
+        Entries remember the dict they were computed from, so a validator invoked directly
+        on a different dict never sees a stale value.
+        """
+        cached = self._segment_cache.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        value = compute()
+        self._segment_cache[key] = (data, value)
+        return value
 
     def _add_requirement_evaluation(
         self,
@@ -56,21 +399,18 @@ class MamadValidator:
         status: str,
         *,
         reason_not_checked: Optional[str] = None,
-        evidence: Optional[List[Dict[str, Any]]] = None,
+        evidence: Optional[Iterable[Dict[str, Any]]] = None,
         notes_he: Optional[str] = None,
     ) -> None:
+        # `evidence` is consumed once and copied into the evaluation, so callers can pass
+        # chain(...) over their own evidence plus the shared threshold lists.
         # If a requirement already passed elsewhere, do not re-evaluate it.
         # Force a consistent explicit not_checked evaluation so UI/coverage are stable.
         if requirement_id in self._skip_requirements:
             # Avoid duplicating the same skip evaluation.
-            for existing in self.requirement_evaluations:
-                if (
-                    isinstance(existing, dict)
-                    and existing.get("requirement_id") == requirement_id
-                    and existing.get("status") == "not_checked"
-                    and existing.get("reason_not_checked") == "already_passed_in_other_segment"
-                ):
-                    return
+            if requirement_id in self._skip_emitted:
+                return
+            self._skip_emitted.add(requirement_id)
             status = "not_checked"
             reason_not_checked = "already_passed_in_other_segment"
             if not notes_he:
@@ -147,47 +487,11 @@ class MamadValidator:
         We keep evidence-first as the source of truth, but mirror failed evaluations
         into violations so that a `failed` requirement cannot appear as a green segment.
         """
+        if not any(isinstance(ev, dict) and ev.get("status") == "failed" for ev in self.requirement_evaluations):
+            return
 
-        severity_by_req: Dict[str, ViolationSeverity] = {
-            "1.2": ViolationSeverity.CRITICAL,
-            "2.1": ViolationSeverity.CRITICAL,
-            "2.2": ViolationSeverity.WARNING,
-            "2.3": ViolationSeverity.CRITICAL,
-            "3.1": ViolationSeverity.WARNING,
-            "3.2": ViolationSeverity.WARNING,
-            "4.2": ViolationSeverity.WARNING,
-            "6.1": ViolationSeverity.WARNING,
-            "6.2": ViolationSeverity.CRITICAL,
-            "6.3": ViolationSeverity.CRITICAL,
-        }
-
-        category_by_req: Dict[str, str] = {
-            "1.2": "קירות",
-            "2.1": "גובה",
-            "2.2": "גובה",
-            "2.3": "שטח",
-            "3.1": "דלת",
-            "3.2": "חלון",
-            "4.2": "אוורור",
-            "6.1": "בטון",
-            "6.2": "פלדה",
-            "6.3": "זיון",
-        }
-
-        requirement_text_by_req: Dict[str, str] = {
-            "1.2": "עובי קיר - 25-40 ס\"מ לפי מספר קירות חיצוניים",
-            "2.1": "גובה מינימלי 2.50 מטר",
-            "2.2": "גובה 2.20 מטר במרתף/תוספת בניה (עם נפח ≥22.5 מ\"ק)",
-            "2.3": "שטח ממ\"ד נטו מינימלי 9 מ\"ר (ללא קירות)",
-            "3.1": "ריווח דלת - ≥90cm מבפנים, ≥75cm מבחוץ",
-            "3.2": "ריווח חלון - ≥20cm בין נישות, ≥100cm בין פתחי אור",
-            "4.2": 'הערת אוורור וסינון בהתאם לת"י 4570',
-            "6.1": "דרגת בטון ב-30 לפחות",
-            "6.2": "פלדה מעוגלת בחום או רתיך בלבד (לא משוכה בקור)",
-            "6.3": "פסיעת זיון: חיצוני ≤20 ס\"מ, פנימי ≤10 ס\"מ",
-        }
-
-        existing_rule_ids = {v.rule_id for v in self.violations}
+        # Rule IDs of violations that existed before mirroring; built on the first failure only.
+        existing_rule_ids: Optional[set[str]] = None
 
         def _summarize_evidence(ev_items: Any) -> str:
             if not isinstance(ev_items, list) or not ev_items:
@@ -196,10 +500,11 @@ class MamadValidator:
             for item in ev_items:
                 if not isinstance(item, dict):
                     continue
-                if item.get("value") is not None:
+                value = item.get("value")
+                if value is not None:
                     try:
                         unit = item.get("unit") or ""
-                        parts.append(f"{float(item.get('value')):.2f} {unit}".strip())
+                        parts.append(f"{float(value):.2f} {unit}".strip())
                     except Exception:
                         pass
                 elif item.get("text"):
@@ -217,24 +522,27 @@ class MamadValidator:
             if not isinstance(req_id, str) or not req_id:
                 continue
             rule_id = f"REQ_{req_id.replace('.', '_')}"
+            if existing_rule_ids is None:
+                existing_rule_ids = {v.rule_id for v in self.violations}
             if rule_id in existing_rule_ids:
                 continue
 
             notes_he = str(ev.get("notes_he") or "")
-            found = _summarize_evidence(ev.get("evidence"))
+            ev_items = ev.get("evidence")
+            found = _summarize_evidence(ev_items)
             location = ""
-            if isinstance(ev.get("evidence"), list) and ev.get("evidence"):
-                first = ev.get("evidence")[0]
+            if isinstance(ev_items, list) and ev_items:
+                first = ev_items[0]
                 if isinstance(first, dict):
                     location = str(first.get("location") or "")
 
             self.violations.append(
                 Violation(
                     rule_id=rule_id,
-                    severity=severity_by_req.get(req_id, ViolationSeverity.WARNING),
-                    category=category_by_req.get(req_id, "כללי"),
+                    severity=_SEVERITY_BY_REQ.get(req_id, ViolationSeverity.WARNING),
+                    category=_CATEGORY_BY_REQ.get(req_id, "כללי"),
                     description_he=notes_he or f"כשל בדרישה {req_id}",
-                    requirement=requirement_text_by_req.get(req_id, f"דרישה {req_id}"),
+                    requirement=_REQUIREMENT_TEXT_BY_REQ.get(req_id, f"דרישה {req_id}"),
                     found=found,
                     location=location,
                 )
@@ -247,6 +555,8 @@ class MamadValidator:
         demo_mode: bool = False,
         enabled_requirements: Optional[set[str]] = None,
         skip_requirements: Optional[set[str]] = None,
+        emit_legacy_violations: bool = True,
+        include_summary_he: bool = True,
     ) -> Dict[str, Any]:
         """
         Validate a single segment's analysis data against MAMAD requirements.
@@ -256,6 +566,11 @@ class MamadValidator:
         Args:
             analysis_data: Extracted data from GPT analysis (includes classification)
             demo_mode: If True, run a reduced subset of checks for demo purposes.
+            emit_legacy_violations: If False, skip mirroring failed evaluations into legacy
+                violations (for callers that only read requirement_evaluations). Severity
+                counts and status are unchanged.
+            include_summary_he: If False, leave decision_summary_he empty (for callers that
+                never display it).
             
         Returns:
             Validation result with violations and status
@@ -263,6 +578,8 @@ class MamadValidator:
         self.violations = []  # Reset violations
         self.requirement_evaluations = []
         self._skip_requirements = set(skip_requirements or set())
+        self._skip_emitted = set()
+        self._segment_cache = {}
         
         # Get segment classification
         classification = analysis_data.get("classification", {})
@@ -274,13 +591,13 @@ class MamadValidator:
         # and include secondary_categories as additional signals.
         categories: List[str] = []
         if isinstance(primary_category_raw, str) and primary_category_raw.strip():
-            parts = re.split(r"[|,]", primary_category_raw)
-            categories.extend([p.strip().upper() for p in parts if p.strip()])
+            parts = _CATEGORY_SPLIT_RE.split(primary_category_raw)
+            categories.extend(p.strip().upper() for p in parts if p.strip())
         elif isinstance(primary_category_raw, list):
-            categories.extend([str(p).strip().upper() for p in primary_category_raw if str(p).strip()])
+            categories.extend(str(p).strip().upper() for p in primary_category_raw if str(p).strip())
 
         if isinstance(secondary_categories_raw, list):
-            categories.extend([str(c).strip().upper() for c in secondary_categories_raw if str(c).strip()])
+            categories.extend(str(c).strip().upper() for c in secondary_categories_raw if str(c).strip())
 
         # Default
         if not categories:
@@ -294,23 +611,6 @@ class MamadValidator:
                    has_dimensions=bool(analysis_data.get("dimensions")),
                    has_elements=bool(analysis_data.get("structural_elements")),
                    demo_mode=demo_mode)
-        # Map categories to validation functions
-        validation_map = {
-            "WALL_SECTION": [self._validate_wall_thickness],
-            "ROOM_LAYOUT": [
-                self._validate_room_height,
-                self._validate_mamad_min_area,
-                self._validate_external_wall_count,
-                self._validate_external_wall_classification,
-                self._validate_tower_continuity,
-            ],
-            "DOOR_DETAILS": [self._validate_door_spacing],
-            "WINDOW_DETAILS": [self._validate_window_spacing],
-            "REBAR_DETAILS": [self._validate_rebar_specifications],
-            "MATERIALS_SPECS": [self._validate_concrete_grade, self._validate_steel_type],
-            "GENERAL_NOTES": [self._validate_ventilation_note],
-            "SECTIONS": [self._validate_room_height, self._validate_high_wall],
-        }
 
         def _has_wall_thickness_evidence(data: Dict[str, Any]) -> bool:
             dims = data.get("dimensions")
@@ -333,24 +633,6 @@ class MamadValidator:
                     if el.get("thickness") is not None:
                         return True
             return False
-        # Which official requirement IDs each validator corresponds to.
-        # IMPORTANT: We only count a requirement as "checked" if the validator actually
-        # had enough evidence to evaluate it (or emitted a missing-info violation).
-        validator_to_requirements = {
-            self._validate_wall_thickness: ["1.2"],
-            self._validate_room_height: ["2.1", "2.2"],
-            self._validate_mamad_min_area: ["2.3"],
-            self._validate_external_wall_count: ["1.1"],
-            self._validate_external_wall_classification: ["1.3"],
-            self._validate_high_wall: ["1.4"],
-            self._validate_tower_continuity: ["1.5"],
-            self._validate_door_spacing: ["3.1"],
-            self._validate_window_spacing: ["3.2"],
-            self._validate_rebar_specifications: ["6.3"],
-            self._validate_concrete_grade: ["6.1"],
-            self._validate_steel_type: ["6.2"],
-            self._validate_ventilation_note: ["4.2"],
-        }
 
         if demo_mode:
             # For demo: focus on groups 1-3 to reduce runtime and complexity.
@@ -360,36 +642,14 @@ class MamadValidator:
                 categories = ["OTHER"]
         
         # Run validations based on ALL classified categories (primary + secondary)
-        validations_to_run = []
-        planned_requirements: set[str] = set()
-        skipped_due_to_already_passed: set[str] = set()
-        for cat in categories:
-            for fn in validation_map.get(cat, []):
-                # If user selected a subset of requirements, only allow validators that map
-                # to at least one enabled requirement.
-                mapped_all = set(validator_to_requirements.get(fn, []))
-
-                # Track requirements that would have been planned but are skipped due to
-                # already passing in other segments.
-                for req in mapped_all:
-                    if req in self._skip_requirements and (enabled_requirements is None or req in enabled_requirements):
-                        skipped_due_to_already_passed.add(req)
-
-                mapped_effective = {r for r in mapped_all if r not in self._skip_requirements}
-
-                if enabled_requirements is not None:
-                    mapped_effective = {r for r in mapped_effective if r in enabled_requirements}
-                    if mapped_all and not mapped_effective:
-                        continue
-                else:
-                    # If all requirements for this validator are skipped, do not run it.
-                    if mapped_all and not mapped_effective:
-                        continue
-
-                if fn not in validations_to_run:
-                    validations_to_run.append(fn)
-                for req in mapped_effective:
-                    planned_requirements.add(req)
+        planned_validators, planned_reqs, skipped_reqs = _plan_validators(
+            tuple(categories),
+            frozenset(enabled_requirements) if enabled_requirements is not None else None,
+            frozenset(self._skip_requirements),
+        )
+        validations_to_run: List[str] = list(planned_validators)
+        planned_requirements: set[str] = set(planned_reqs)
+        skipped_due_to_already_passed: set[str] = set(skipped_reqs)
 
         # Heuristic: Some segments are classified as ROOM_LAYOUT but still contain
         # explicit wall thickness callouts (e.g., 20/25/30/40 along wall lines).
@@ -399,8 +659,8 @@ class MamadValidator:
         should_force_12 = wants_12 or has_thickness
         if should_force_12:
             if (enabled_requirements is None or "1.2" in enabled_requirements) and "1.2" not in self._skip_requirements:
-                if self._validate_wall_thickness not in validations_to_run:
-                    validations_to_run.append(self._validate_wall_thickness)
+                if "_validate_wall_thickness" not in validations_to_run:
+                    validations_to_run.append("_validate_wall_thickness")
                 planned_requirements.add("1.2")
 
         # Manual ROI / unknown classification handling:
@@ -411,7 +671,7 @@ class MamadValidator:
         # of claiming that no checks were performed.
         ran_by_enabled_requirements = False
         if enabled_requirements is not None and not validations_to_run:
-            for fn, reqs in validator_to_requirements.items():
+            for fn, reqs in _VALIDATOR_REQUIREMENTS.items():
                 mapped_all = set(reqs)
                 for req in mapped_all:
                     if req in self._skip_requirements and req in enabled_requirements:
@@ -450,38 +710,51 @@ class MamadValidator:
             # If category not recognized or OTHER, skip validation
             logger.info("No specific validations for this segment category",
                        category=primary_category)
-            if demo_mode:
-                decision_summary_he = (
-                    f"לא הופעלו בדיקות כי בדמו המערכת מתמקדת בדרישות 1–3 בלבד, "
-                    f"והקטגוריה שסווגה היא '{primary_category}'."
-                )
-            else:
-                decision_summary_he = (
-                    f"לא הופעלו בדיקות כי הקטגוריה שסווגה היא '{primary_category}'. "
-                    "המערכת מפעילה בדיקות רק עבור קטגוריות מוגדרות (כמו ROOM_LAYOUT/SECTIONS/WALL_SECTION וכו')."
-                )
         else:
             checked_set: set[str] = set()
-            for validation_func in validations_to_run:
-                did_check = validation_func(analysis_data)
-                # Safety: if a validator didn't explicitly confirm it checked evidence,
-                # we treat it as NOT checked (prevents false "passed" without evidence).
-                if did_check is None:
-                    did_check = False
+            try:
+                for validator_name in validations_to_run:
+                    did_check = getattr(self, validator_name)(analysis_data)
+                    # Safety: if a validator didn't explicitly confirm it checked evidence,
+                    # we treat it as NOT checked (prevents false "passed" without evidence).
+                    if did_check is None:
+                        did_check = False
+            finally:
+                # Do not keep the segment payload alive on the shared validator between requests.
+                self._segment_cache.clear()
 
             # Compute checked requirements from explicit evaluations (evidence-first).
             for ev in self.requirement_evaluations:
                 if not isinstance(ev, dict):
                     continue
+                if ev.get("status") not in _TERMINAL_STATUSES:
+                    continue
                 req_id = ev.get("requirement_id")
-                status = ev.get("status")
-                if req_id and status in {"passed", "failed"}:
+                if req_id:
                     checked_set.add(req_id)
 
             checked_requirements = sorted(checked_set)
             skipped_requirements = sorted(planned_requirements - checked_set)
 
-            if demo_mode:
+        if include_summary_he:
+            if not validations_to_run:
+                if demo_mode:
+                    decision_summary_he = (
+                        f"לא הופעלו בדיקות כי בדמו המערכת מתמקדת בדרישות 1–3 בלבד, "
+                        f"והקטגוריה שסווגה היא '{primary_category}'."
+                    )
+                else:
+                    decision_summary_he = (
+                        f"לא הופעלו בדיקות כי הקטגוריה שסווגה היא '{primary_category}'. "
+                        "המערכת מפעילה בדיקות רק עבור קטגוריות מוגדרות (כמו ROOM_LAYOUT/SECTIONS/WALL_SECTION וכו')."
+                    )
+            elif ran_by_enabled_requirements and not checked_requirements:
+                decision_summary_he = (
+                    f"הופעלו בדיקות לפי בחירת המשתמש (check_groups) למרות שהסיווג לא היה חד-משמעי. "
+                    f"לא נמצאו ראיות מספיקות כדי לאמת אף דרישה בסגמנט זה. "
+                    f"דרישות שנוסו: {', '.join(sorted(planned_requirements)) if planned_requirements else 'אין'}."
+                )
+            elif demo_mode:
                 decision_summary_he = (
                     f"(דמו) הופעלו בדיקות לפי קטגוריות הסגמנט: {', '.join(categories)}. "
                     f"דרישות שנבדקו בדמו בסגמנט זה: {', '.join(checked_requirements) if checked_requirements else 'אין'}. "
@@ -494,20 +767,32 @@ class MamadValidator:
                     "דרישות אחרות לא נבדקו כי הן ממופות לקטגוריות אחרות או דורשות סגמנטים מסוג אחר (למשל פרט/חתך)."
                 )
 
-            if ran_by_enabled_requirements and not checked_requirements:
-                decision_summary_he = (
-                    f"הופעלו בדיקות לפי בחירת המשתמש (check_groups) למרות שהסיווג לא היה חד-משמעי. "
-                    f"לא נמצאו ראיות מספיקות כדי לאמת אף דרישה בסגמנט זה. "
-                    f"דרישות שנוסו: {', '.join(sorted(planned_requirements)) if planned_requirements else 'אין'}."
-                )
-
         # Mirror evidence-first failures into legacy violations for UI/back-compat.
-        self._sync_violations_from_requirement_evaluations()
+        if emit_legacy_violations:
+            self._sync_violations_from_requirement_evaluations()
+            severities = [v.severity for v in self.violations]
+        else:
+            # Same severities the mirror would assign, without building Violation objects.
+            severities = [
+                _SEVERITY_BY_REQ.get(ev["requirement_id"], ViolationSeverity.WARNING)
+                for ev in self.requirement_evaluations
+                if isinstance(ev, dict)
+                and ev.get("status") == "failed"
+                and isinstance(ev.get("requirement_id"), str)
+                and ev["requirement_id"]
+            ]
         
-        # Categorize violations
-        critical = [v for v in self.violations if v.severity == ViolationSeverity.CRITICAL]
-        errors = [v for v in self.violations if v.severity == ViolationSeverity.ERROR]
-        warnings = [v for v in self.violations if v.severity == ViolationSeverity.WARNING]
+        # Categorize violations (single pass; only the counts are reported)
+        critical_count = 0
+        error_count = 0
+        warning_count = 0
+        for severity in severities:
+            if severity == ViolationSeverity.CRITICAL:
+                critical_count += 1
+            elif severity == ViolationSeverity.ERROR:
+                error_count += 1
+            elif severity == ViolationSeverity.WARNING:
+                warning_count += 1
 
         # IMPORTANT:
         # A segment must never be marked as "passed" if we didn't actually check any requirements.
@@ -515,7 +800,7 @@ class MamadValidator:
         checks_performed = bool(checked_requirements)
         # Non-breaking signal for UI/stream: validators may have run but still end in not_checked.
         checks_attempted = bool(validations_to_run) or bool(self.requirement_evaluations)
-        has_failures = len(critical) > 0 or len(errors) > 0
+        has_failures = critical_count > 0 or error_count > 0
 
         if has_failures:
             status = "failed"
@@ -531,24 +816,24 @@ class MamadValidator:
                    status=status,
                    passed=passed,
                    checks_performed=checks_performed,
-                   critical=len(critical),
-                   errors=len(errors),
-                   warnings=len(warnings))
+                   critical=critical_count,
+                   errors=error_count,
+                   warnings=warning_count)
         
         return {
             "status": status,
             "passed": passed,
             "total_violations": len(self.violations),
-            "critical_count": len(critical),
-            "error_count": len(errors),
-            "warning_count": len(warnings),
+            "critical_count": critical_count,
+            "error_count": error_count,
+            "warning_count": warning_count,
             "violations": [self._violation_to_dict(v) for v in self.violations],
             "checked_requirements": checked_requirements,
             "requirement_evaluations": self.requirement_evaluations,
             "decision_summary_he": decision_summary_he,
             "debug": {
                 "categories_used": categories,
-                "validators_run": [fn.__name__ for fn in validations_to_run],
+                "validators_run": list(validations_to_run),
                 "primary_category": primary_category,
                 "relevant_requirements": relevant_requirements,
                 "demo_mode": demo_mode,
@@ -584,12 +869,10 @@ class MamadValidator:
         - 3 external walls: 30cm
         - 4 external walls: 40cm
         """
-        text_items = data.get("text_items", []) or []
-        annotations = data.get("annotations", []) or []
-        all_text = " ".join(str(t.get("text") or "") for t in (text_items + annotations) if isinstance(t, dict))
+        all_text = self._segment_feature(data, "notes_text", lambda: self._notes_text(data))
         all_text_lower = all_text.lower()
-        mamad_label_present = ("ממ\"ד" in all_text) or ("ממד" in all_text) or ("ממ״ד" in all_text_lower) or ("mamad" in all_text_lower)
-        scale_1_50_present = bool(re.search(r"\b1\s*[:/]\s*50\b", all_text)) or ("קנ\"מ" in all_text and "50" in all_text)
+        mamad_label_present = ("ממ\"ד" in all_text) or ("ממד" in all_text) or ("mamad" in all_text_lower)
+        scale_1_50_present = bool(_SCALE_1_50_RE.search(all_text)) or ("קנ\"מ" in all_text and "50" in all_text)
         if not mamad_label_present or not scale_1_50_present:
             self._add_requirement_evaluation(
                 "1.2",
@@ -609,7 +892,7 @@ class MamadValidator:
             )
             return False
 
-        walls = [e for e in elements if e.get("type") in ["wall", "קיר", "קיר חיצוני"]]
+        walls = [e for e in elements if e.get("type") in _WALL_TYPES]
         if not walls:
             # Not enough information to evaluate thickness.
             self._add_requirement_evaluation(
@@ -622,33 +905,7 @@ class MamadValidator:
         
         def _infer_sides_from_text(text: str) -> set[str]:
             t = (text or "").lower()
-            sides: set[str] = set()
-            # Hebrew
-            if any(k in t for k in ["שמאל", "צד שמאל", "קיר שמאל", "שמאלה"]):
-                sides.add("left")
-            if any(k in t for k in ["ימין", "צד ימין", "קיר ימין", "ימינה"]):
-                sides.add("right")
-            if any(k in t for k in ["עליון", "למעלה", "צד עליון", "קיר עליון", "צפון"]):
-                sides.add("top")
-            if any(k in t for k in ["תחתון", "למטה", "צד תחתון", "קיר תחתון", "דרום"]):
-                sides.add("bottom")
-            # English
-            if "left" in t:
-                sides.add("left")
-            if "right" in t:
-                sides.add("right")
-            # Be conservative: free-form OCR locations often include words like "top"/"bottom"
-            # that describe drawing placement (not the room's wall side). Only accept these when
-            # explicitly tied to a wall/side direction.
-            if any(p in t for p in ["north wall", "wall north", "top wall", "wall top", "top side", "upper wall"]):
-                sides.add("top")
-            if any(p in t for p in ["south wall", "wall south", "bottom wall", "wall bottom", "bottom side", "lower wall"]):
-                sides.add("bottom")
-            if "east" in t:
-                sides.add("right")
-            if "west" in t:
-                sides.add("left")
-            return sides
+            return {side for side, pattern in _WALL_SIDE_RES if pattern.search(t)}
 
         def _infer_sides_from_any(obj: Any) -> set[str]:
             """Extract side hints from nested dict/list evidence structures."""
@@ -690,7 +947,7 @@ class MamadValidator:
             combined = f"{loc} {notes}"
             if el_type == "door":
                 # Stronger signal when it's explicitly a MAMAD door.
-                if any(k in combined for k in ["ממ\"ד", "ממד", "ד.ה", "דלת הדף", "דלת ממ\"ד", "משוריינת", "ממ" ]):
+                if _MAMAD_DOOR_RE.search(combined):
                     door_sides |= _infer_sides_from_text(combined)
             elif el_type == "window":
                 has_any_window = True
@@ -698,25 +955,14 @@ class MamadValidator:
                 combined_lower = combined.lower()
 
                 # Blast-window markers (not necessarily sliding).
-                if any(k in combined for k in ["חלון הדף", "הדף", "ת\"י 4422", "4422", "ממ\"ד", "ממד", "blast"]):
+                if _BLAST_WINDOW_RE.search(combined):
                     has_mamad_window_marker = True
 
                 # Sliding-window markers: the 30cm window-case in 1.2 applies ONLY to sliding blast windows.
                 # Be conservative: only treat as sliding when explicitly indicated.
-                if any(
-                    k in combined_lower
-                    for k in [
-                        "נגרר",
-                        "נגררת",
-                        "נגררים",
-                        "נישת גרירה",
-                        "גרירה",
-                        "sliding",
-                        "pocket",
-                    ]
-                ):
+                if _SLIDING_WINDOW_RE.search(combined_lower):
                     has_sliding_window_marker = True
-                if any(k in combined.lower() for k in ["קיר חיצוני", "חיצוני", "external", "outside", "exterior", "חזית", "מעטפת", "perimeter", "outer"]):
+                if _WINDOW_EXTERNAL_RE.search(combined_lower):
                     window_external_marker_present = True
 
         def _classify_wall_exposure(location_text: str, wall_type_text: str, *, wall: Dict[str, Any]) -> str:
@@ -733,39 +979,12 @@ class MamadValidator:
                 ev_text = " ".join([str(x) for x in ev_items])
             combined_lower = f"{location_text or ''} {wall_type_text or ''} {wall_notes} {ev_text}".lower()
 
-            # Explicit external markers
-            external_markers = [
-                "קיר חיצוני",
-                "חיצוני",
-                "external",
-                "outside",
-                "exterior",
-                "חזית",
-                "מעטפת",
-                "היקפי",
-                "perimeter",
-                "cyan perimeter",
-                "outer band",
-                "outer wall",
-            ]
-            # Explicit internal markers
-            internal_markers = [
-                "קיר פנימי",
-                "פנימי",
-                "internal",
-                "inside",
-                "partition",
-                "adjacent",
-                "אזור פנימי",
-                "חלל פנימי",
-            ]
-
             # If any internal marker appears, treat as internal even if 'outer wall' appears,
             # because some drawings use 'outer wall' loosely for wall thickness callouts.
-            if any(m.lower() in combined_lower for m in internal_markers):
+            if _WALL_INTERNAL_RE.search(combined_lower):
                 return "internal"
 
-            if any(m.lower() in combined_lower for m in external_markers):
+            if _WALL_EXTERNAL_RE.search(combined_lower):
                 return "external"
 
             # Side-hint inference from wall context (location/notes/evidence)
@@ -818,7 +1037,7 @@ class MamadValidator:
         external_sides_inferred: set[str] = set()
         internal_sides_inferred: set[str] = set()
 
-        def _has_any_marker(*, wall: Dict[str, Any], markers: List[str]) -> bool:
+        def _has_any_marker(*, wall: Dict[str, Any], markers: "re.Pattern[str]") -> bool:
             wall_location = str(wall.get("location") or "")
             wall_type = str(wall.get("type") or "")
             wall_notes = str(wall.get("notes") or "")
@@ -827,7 +1046,7 @@ class MamadValidator:
             if isinstance(ev_items, list):
                 ev_text = " ".join([str(x) for x in ev_items])
             combined_lower = f"{wall_location} {wall_type} {wall_notes} {ev_text}".lower()
-            return any(m.lower() in combined_lower for m in markers)
+            return markers.search(combined_lower) is not None
         for wall in walls:
             thickness_str = wall.get("thickness", "")
             
@@ -853,22 +1072,7 @@ class MamadValidator:
                 parsed_external_thicknesses.append(thickness_cm)
                 external_walls_observed += 1
                 # Track explicit external marker separately for absolute-min failure.
-                if _has_any_marker(
-                    wall=wall,
-                    markers=[
-                        "קיר חיצוני",
-                        "חיצוני",
-                        "external",
-                        "outside",
-                        "exterior",
-                        "חזית",
-                        "מעטפת",
-                        "היקפי",
-                        "perimeter",
-                        "outer wall",
-                        "outer band",
-                    ],
-                ):
+                if _has_any_marker(wall=wall, markers=_WALL_EXTERNAL_RE):
                     explicit_external_thicknesses.append(thickness_cm)
                 # If this wall references multiple sides, treat them as external unless a MAMAD door marks a side internal.
                 if wall_side_hints:
@@ -1120,19 +1324,18 @@ class MamadValidator:
             num_external_known,
             has_window=has_sliding_window_on_external,
         )
+        walls_location = f"external_walls={num_external_known}"
+        required_evidence = self._evidence_dimension(
+            value=required_thickness,
+            unit="cm",
+            element="required_min_wall_thickness",
+            location=walls_location,
+        )
         if min_external_thickness < required_thickness:
             self._add_requirement_evaluation(
                 "1.2",
                 "failed",
-                evidence=evidence
-                + [
-                    self._evidence_dimension(
-                        value=required_thickness,
-                        unit="cm",
-                        element="required_min_wall_thickness",
-                        location=f"external_walls={num_external_known}",
-                    )
-                ],
+                evidence=chain(evidence, (required_evidence,)),
                 notes_he=(
                     f"נמצא עובי קיר חיצוני {min_external_thickness:.0f} ס\"מ קטן מהמינימום {required_thickness} ס\"מ "
                     f"(לפי {num_external_known} קירות חיצוניים)."
@@ -1143,36 +1346,31 @@ class MamadValidator:
         self._add_requirement_evaluation(
             "1.2",
             "passed",
-            evidence=evidence
-            + [
-                self._evidence_dimension(
-                    value=required_thickness,
-                    unit="cm",
-                    element="required_min_wall_thickness",
-                    location=f"external_walls={num_external_known}",
-                )
-            ]
-            + [
-                self._evidence_text(
-                    text=f"מספר קירות חיצוניים מזוהה: {num_external_known}",
-                    element="wall_thickness_context",
-                    location=f"external_walls={num_external_known}",
-                ),
-                self._evidence_text(
-                    text=f"עובי קיר חיצוני מינימלי שנמצא: {min_external_thickness:.0f} ס\"מ",
-                    element="wall_thickness_observed",
-                    location=f"external_walls={num_external_known}",
-                ),
-                self._evidence_text(
-                    text=(
-                        "חלון הדף נגרר בקיר חיצוני: כן"
-                        if has_sliding_window_on_external
-                        else ("חלון הדף נגרר בקיר חיצוני: לא זוהה" if has_any_window else "לא זוהה חלון הדף בסגמנט")
+            evidence=chain(
+                evidence,
+                (
+                    required_evidence,
+                    self._evidence_text(
+                        text=f"מספר קירות חיצוניים מזוהה: {num_external_known}",
+                        element="wall_thickness_context",
+                        location=walls_location,
+                    ),
+                    self._evidence_text(
+                        text=f"עובי קיר חיצוני מינימלי שנמצא: {min_external_thickness:.0f} ס\"מ",
+                        element="wall_thickness_observed",
+                        location=walls_location,
+                    ),
+                    self._evidence_text(
+                        text=(
+                            "חלון הדף נגרר בקיר חיצוני: כן"
+                            if has_sliding_window_on_external
+                            else ("חלון הדף נגרר בקיר חיצוני: לא זוהה" if has_any_window else "לא זוהה חלון הדף בסגמנט")
+                        ),
+                        element="wall_thickness_window_case",
+                        location=walls_location,
                     ),
-                    element="wall_thickness_window_case",
-                    location=f"external_walls={num_external_known}",
                 ),
-            ],
+            ),
             notes_he=(
                 f"עובי הקירות החיצוניים שפוענחו עומד בדרישה: מינימום {required_thickness} ס\"מ "
                 f"(לפי {num_external_known} קירות חיצוניים)."
@@ -1191,12 +1389,7 @@ class MamadValidator:
         # Determine whether this segment is likely to contain a ROOM height (not an opening height).
         # IMPORTANT: use PRIMARY category only (secondary labels are often noisy on mixed crops).
         classification = data.get("classification", {})
-        primary_category_raw = classification.get("primary_category", "")
-        primary_category = ""
-        if isinstance(primary_category_raw, str) and primary_category_raw.strip():
-            primary_category = re.split(r"[|,]", primary_category_raw.strip())[0].strip().upper()
-        elif isinstance(primary_category_raw, list) and primary_category_raw:
-            primary_category = str(primary_category_raw[0]).strip().upper()
+        primary_category = _primary_category(classification)
 
         # View type gating: height (2.1/2.2) should only be extracted from vertical sections.
         # Floor plans / top-view crops frequently contain H=/installation heights that are NOT room height.
@@ -1213,8 +1406,8 @@ class MamadValidator:
         text_items = data.get("text_items", [])
         annotations = data.get("annotations", [])
         all_text_lower = " ".join(
-            [str(t.get("text", "")) for t in (text_items + annotations)]
-        ).lower()
+            [str(t.get("text", "")) for t in chain(text_items, annotations)]
+        ).lower().translate(_HEBREW_QUOTES_TO_ASCII)
 
         h_equals_present = "h=" in all_text_lower
         generic_height_word_present = "height" in all_text_lower
@@ -1247,46 +1440,30 @@ class MamadValidator:
             # Do not treat generic height markers (e.g., H=) as proof this is a section.
             segment_is_section_like = primary_category in {"SECTIONS", "WALL_SECTION"}
         
-        def _is_opening_height_dimension(d: Dict[str, Any]) -> bool:
+        # Find the best-scoring *room* height dimension in one pass (skip door/window
+        # heights like 80/200). Ties keep the earliest dimension.
+        height_dim: Optional[Dict[str, Any]] = None
+        best_score = -1
+        for d in dimensions:
             element = str(d.get("element", "")).lower()
+            if "גובה" not in element and "height" not in element:
+                continue
             location = str(d.get("location", "")).lower()
             # If it's explicitly tied to openings, it is NOT a room height.
-            opening_markers = [
-                "door", "window", "opening", "jamb",
-                "דלת", "חלון", "פתח", "משקוף",
-            ]
-            if any(m in element for m in opening_markers):
-                return True
-            if any(m in location for m in opening_markers):
-                return True
-            return False
-
-        # Find *room* height dimensions (avoid door/window heights like 80/200)
-        raw_height_dims = [
-            d for d in dimensions
-            if ("גובה" in str(d.get("element", "")).lower())
-            or ("height" in str(d.get("element", "")).lower())
-        ]
-        height_dims = [d for d in raw_height_dims if not _is_opening_height_dimension(d)]
-
-        def _height_dim_score(d: Dict[str, Any]) -> int:
-            element = str(d.get("element", "")).lower()
-            location = str(d.get("location", "")).lower()
-            score = 0
+            if _OPENING_MARKER_RE.search(element) or _OPENING_MARKER_RE.search(location):
+                continue
+            score = 1
             if "חדר" in element or "room" in element:
                 score += 5
             if "תקרה" in element or "ceiling" in element:
                 score += 4
-            if "גובה" in element or "height" in element:
-                score += 1
             if "חתך" in location or "section" in location:
                 score += 1
-            return score
+            if score > best_score:
+                height_dim = d
+                best_score = score
 
-        if height_dims:
-            height_dims.sort(key=_height_dim_score, reverse=True)
-        
-        if not height_dims:
+        if height_dim is None:
             # If the segment is not primarily a section and does not explicitly include height markers,
             # don't penalize it for missing room height.
             if not segment_is_section_like:
@@ -1306,18 +1483,19 @@ class MamadValidator:
 
             # Evidence-first: missing room height is not treated as a failure unless we have
             # strong evidence that this segment should contain it. Mark as not_checked.
+            not_found_evidence = [self._evidence_text(text="לא נמצא מימד גובה חדר בסגמנט", element="room_height")]
             self._add_requirement_evaluation(
                 "2.1",
                 "not_checked",
                 reason_not_checked="room_height_not_found",
-                evidence=[self._evidence_text(text="לא נמצא מימד גובה חדר בסגמנט", element="room_height")],
+                evidence=not_found_evidence,
                 notes_he="לא נמצא מימד שמזוהה בבירור כגובה חדר.",
             )
             self._add_requirement_evaluation(
                 "2.2",
                 "not_checked",
                 reason_not_checked="room_height_not_found",
-                evidence=[self._evidence_text(text="לא נמצא מימד גובה חדר בסגמנט", element="room_height")],
+                evidence=not_found_evidence,
                 notes_he="לא נמצא מימד שמזוהה בבירור כגובה חדר.",
             )
             return False
@@ -1361,17 +1539,17 @@ class MamadValidator:
         ):
             # Provide evidence so the UI can show what was found but why we didn't use it.
             try:
-                candidate_height_m = self._extract_dimension_value(height_dims[0].get("value", ""), "m")
+                candidate_height_m = self._extract_dimension_value(height_dim.get("value", ""), "m")
             except Exception:
                 candidate_height_m = None
             candidate_evidence = [
                 self._evidence_dimension(
                     value=candidate_height_m,
-                    unit="m" if candidate_height_m is not None else str(height_dims[0].get("unit") or ""),
-                    element=str(height_dims[0].get("element") or "room_height_candidate"),
-                    location=str(height_dims[0].get("location") or ""),
-                    text=str(height_dims[0].get("value") or ""),
-                    raw=height_dims[0],
+                    unit="m" if candidate_height_m is not None else str(height_dim.get("unit") or ""),
+                    element=str(height_dim.get("element") or "room_height_candidate"),
+                    location=str(height_dim.get("location") or ""),
+                    text=str(height_dim.get("value") or ""),
+                    raw=height_dim,
                 )
             ]
             self._add_requirement_evaluation(
@@ -1394,40 +1572,32 @@ class MamadValidator:
             return False
         
         # Get height value
-        height_m = self._extract_dimension_value(height_dims[0].get("value", ""), "m")
+        height_m = self._extract_dimension_value(height_dim.get("value", ""), "m")
         
         if height_m is None:
             # We attempted to evaluate height but couldn't parse it reliably.
+            unparseable_evidence = [
+                self._evidence_dimension(
+                    value=None,
+                    unit=str(height_dim.get("unit") or ""),
+                    element=str(height_dim.get("element") or "room_height"),
+                    location=str(height_dim.get("location") or ""),
+                    text=str(height_dim.get("value") or ""),
+                    raw=height_dim,
+                )
+            ]
             self._add_requirement_evaluation(
                 "2.1",
                 "not_checked",
                 reason_not_checked="unparseable_room_height",
-                evidence=[
-                    self._evidence_dimension(
-                        value=None,
-                        unit=str(height_dims[0].get("unit") or ""),
-                        element=str(height_dims[0].get("element") or "room_height"),
-                        location=str(height_dims[0].get("location") or ""),
-                        text=str(height_dims[0].get("value") or ""),
-                        raw=height_dims[0],
-                    )
-                ],
+                evidence=unparseable_evidence,
                 notes_he="נמצא מימד גובה אך לא ניתן היה לפענח את הערך בצורה אמינה.",
             )
             self._add_requirement_evaluation(
                 "2.2",
                 "not_checked",
                 reason_not_checked="unparseable_room_height",
-                evidence=[
-                    self._evidence_dimension(
-                        value=None,
-                        unit=str(height_dims[0].get("unit") or ""),
-                        element=str(height_dims[0].get("element") or "room_height"),
-                        location=str(height_dims[0].get("location") or ""),
-                        text=str(height_dims[0].get("value") or ""),
-                        raw=height_dims[0],
-                    )
-                ],
+                evidence=unparseable_evidence,
                 notes_he="נמצא מימד גובה אך לא ניתן היה לפענח את הערך בצורה אמינה.",
             )
             return False
@@ -1435,7 +1605,7 @@ class MamadValidator:
         # Confidence/plausibility guardrails:
         # - Prevent obvious misreads (e.g., wall thickness '30'cm parsed as 0.30m room height)
         # - Avoid failing height rules on low-confidence, weakly-signaled measurements
-        dim_conf_raw = height_dims[0].get("confidence", None)
+        dim_conf_raw = height_dim.get("confidence", None)
         try:
             dim_confidence = float(dim_conf_raw) if dim_conf_raw is not None else 1.0
         except Exception:
@@ -1445,10 +1615,10 @@ class MamadValidator:
             self._evidence_dimension(
                 value=height_m,
                 unit="m",
-                element=str(height_dims[0].get("element") or "room_height"),
-                location=str(height_dims[0].get("location") or ""),
-                text=str(height_dims[0].get("value") or ""),
-                raw=height_dims[0],
+                element=str(height_dim.get("element") or "room_height"),
+                location=str(height_dim.get("location") or ""),
+                text=str(height_dim.get("value") or ""),
+                raw=height_dim,
             )
         ]
 
@@ -1515,7 +1685,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "2.1",
                 "passed",
-                evidence=height_evidence + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+                evidence=chain(height_evidence, self._height_required_evidence),
                 notes_he="גובה החדר עומד בדרישה המינימלית (2.50 מ').",
             )
             self._add_requirement_evaluation(
@@ -1534,14 +1704,14 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "2.1",
                 "failed",
-                evidence=height_evidence + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+                evidence=chain(height_evidence, self._height_required_evidence),
                 notes_he="גובה החדר נמוך מהמינימום הסטנדרטי 2.50 מ'.",
             )
             self._add_requirement_evaluation(
                 "2.2",
                 "not_checked",
                 reason_not_checked="height_below_exception_min",
-                evidence=height_evidence + [self._evidence_dimension(value=2.20, unit="m", element="required_exception_min_height")],
+                evidence=chain(height_evidence, self._height_exception_required_evidence),
                 notes_he="הגובה נמוך מ-2.20 מ' ולכן החריג (2.2) אינו יכול לחול; הכשל מדווח במסגרת 2.1.",
             )
             return True
@@ -1570,8 +1740,7 @@ class MamadValidator:
                         continue
                     unit = str(d.get("unit") or "").strip().lower()
                     element = str(d.get("element") or "").lower()
-                    loc = str(d.get("location") or "").lower()
-                    if unit in {"m3", "m^3", "m³", "מ\"ק"} or ("מ\"ק" in element) or ("נפח" in element) or ("volume" in element):
+                    if unit in _VOLUME_UNITS or ("מ\"ק" in element) or ("נפח" in element) or ("volume" in element):
                         v = self._extract_dimension_value(d.get("value"), "m3")
                         if v is not None:
                             return v
@@ -1585,9 +1754,10 @@ class MamadValidator:
                         except Exception:
                             pass
                     # Heuristic: free-text location/element contains "נפח" and a number.
+                    loc = str(d.get("location") or "").lower()
                     s = f"{element} {loc}"
                     if "נפח" in s or "volume" in s:
-                        m = re.search(r"(?<!\d)(\d{1,3}(?:\.\d+)?)\s*(?:m3|m\^3|m³|מ\"ק)\b", s, flags=re.IGNORECASE)
+                        m = _VOLUME_IN_LABEL_RE.search(s)
                         if m:
                             try:
                                 return float(m.group(1))
@@ -1595,7 +1765,7 @@ class MamadValidator:
                                 pass
 
             # Look in text items/annotations.
-            m = re.search(r"(?i)(?:נפח|volume|v\s*=)\s*[:=]?\s*(\d{1,3}(?:\.\d+)?)\s*(?:m3|m\^3|m³|מ\"ק)", all_text_lower)
+            m = _VOLUME_IN_TEXT_RE.search(all_text_lower)
             if m:
                 try:
                     return float(m.group(1))
@@ -1611,36 +1781,34 @@ class MamadValidator:
                 self._add_requirement_evaluation(
                     "2.1",
                     "failed",
-                    evidence=height_evidence
-                    + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+                    evidence=chain(height_evidence, self._height_required_evidence),
                     notes_he="גובה החדר נמוך מ-2.50 מ' ולכן אינו עומד בדרישה הסטנדרטית (וחריג 2.2 לא אומת עקב חסר בנפח).",
                 )
                 self._add_requirement_evaluation(
                     "2.2",
                     "not_checked",
                     reason_not_checked="missing_exception_volume",
-                    evidence=height_evidence + [self._evidence_dimension(value=22.5, unit="m3", element="required_min_volume")],
+                    evidence=chain(height_evidence, self._volume_required_evidence),
                     notes_he="זוהו סימנים למרתף/תוספת בניה אך לא נמצא נפח חדר מפורש (נדרש ≥22.5 מ\"ק) כדי לאשר חריג 2.2.",
                 )
                 return True
 
             volume_evidence = [
                 self._evidence_dimension(value=volume_m3, unit="m3", element="room_volume", location=""),
-                self._evidence_dimension(value=22.5, unit="m3", element="required_min_volume"),
-            ]
+            ] + self._volume_required_evidence
 
             if volume_m3 >= 22.5:
                 # Exception satisfied: treat as compliant for height.
                 self._add_requirement_evaluation(
                     "2.2",
                     "passed",
-                    evidence=height_evidence + volume_evidence,
+                    evidence=chain(height_evidence, volume_evidence),
                     notes_he="החריג (2.2) חל: הסגמנט מצביע על מרתף/תוספת בניה ונפח ≥22.5 מ\"ק, ולכן גובה 2.20–2.50 מ' מותר.",
                 )
                 self._add_requirement_evaluation(
                     "2.1",
                     "passed",
-                    evidence=height_evidence + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+                    evidence=chain(height_evidence, self._height_required_evidence),
                     notes_he="גובה החדר נמוך מ-2.50 מ' אך החריג 2.2 חל, ולכן דרישת הגובה מתקיימת.",
                 )
                 return True
@@ -1649,14 +1817,13 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "2.1",
                 "failed",
-                evidence=height_evidence
-                + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+                evidence=chain(height_evidence, self._height_required_evidence),
                 notes_he="גובה החדר נמוך מ-2.50 מ' ולכן אינו עומד בדרישה הסטנדרטית.",
             )
             self._add_requirement_evaluation(
                 "2.2",
                 "failed",
-                evidence=height_evidence + volume_evidence,
+                evidence=chain(height_evidence, volume_evidence),
                 notes_he="החריג (2.2) אינו חל: זוהה מרתף/תוספת בניה אך נפח החדר קטן מ-22.5 מ\"ק, ולכן גובה מתחת 2.50 מ' אינו מותר.",
             )
             return True
@@ -1665,7 +1832,7 @@ class MamadValidator:
         self._add_requirement_evaluation(
             "2.1",
             "failed",
-            evidence=height_evidence + [self._evidence_dimension(value=2.50, unit="m", element="required_min_height")],
+            evidence=chain(height_evidence, self._height_required_evidence),
             notes_he="גובה החדר נמוך מ-2.50 מ' ולכן אינו עומד בדרישה הסטנדרטית.",
         )
         self._add_requirement_evaluation(
@@ -1682,13 +1849,11 @@ class MamadValidator:
         Rule 2.3: Minimum net area (without walls) must be >= 9 m².
         Evaluate only on MAMAD plan segments at scale 1:50.
         """
-        text_items = data.get("text_items", []) or []
-        annotations = data.get("annotations", []) or []
-        all_text = " ".join(str(t.get("text") or "") for t in (text_items + annotations) if isinstance(t, dict))
+        all_text = self._segment_feature(data, "notes_text", lambda: self._notes_text(data))
         all_text_lower = all_text.lower()
 
-        mamad_label_present = ("ממ\"ד" in all_text) or ("ממד" in all_text) or ("ממ״ד" in all_text_lower) or ("mamad" in all_text_lower)
-        scale_1_50_present = bool(re.search(r"\b1\s*[:/]\s*50\b", all_text)) or ("קנ\"מ" in all_text and "50" in all_text)
+        mamad_label_present = ("ממ\"ד" in all_text) or ("ממד" in all_text) or ("mamad" in all_text_lower)
+        scale_1_50_present = bool(_SCALE_1_50_RE.search(all_text)) or ("קנ\"מ" in all_text and "50" in all_text)
 
         classification = data.get("classification", {}) or {}
         view_type = str(classification.get("view_type") or "").lower()
@@ -1729,61 +1894,26 @@ class MamadValidator:
             text = str(d.get("text") or "").lower()
             combined = f"{element} {location} {text}"
 
-            include_markers = [
-                "ממ\"ד",
-                "ממד",
-                "ממ״ד",
-                "mamad",
-                "room",
-                "חדר",
-                "אורך",
-                "רוחב",
-                "length",
-                "width",
-                "מידות",
-                "dimensions",
-                "פנימי",
-            ]
-            exclude_markers = [
-                "עובי",
-                "thickness",
-                "door",
-                "window",
-                "פתח",
-                "גובה",
-                "height",
-                "סף",
-                "משקוף",
-                "משקופים",
-            ]
-            if any(k in combined for k in exclude_markers):
+            if _ROOM_DIM_EXCLUDE_RE.search(combined):
                 return False
-            return any(k in combined for k in include_markers) or ("ממ\"ד" in all_text or "ממד" in all_text)
+            return _ROOM_DIM_INCLUDE_RE.search(combined) is not None or ("ממ\"ד" in all_text or "ממד" in all_text)
 
         def _is_overall_dimension(d: Dict[str, Any]) -> bool:
             element = str(d.get("element") or "").lower()
             location = str(d.get("location") or "").lower()
             text = str(d.get("text") or "").lower()
             combined = f"{element} {location} {text}"
-            overall_markers = [
-                "overall",
-                "כולל",
-                "חוץ",
-                "external",
-                "ברוטו",
-                "ברוטו",
-                "gross",
-                "outer",
-            ]
-            return any(k in combined for k in overall_markers)
+            return _OVERALL_DIM_RE.search(combined) is not None
 
         def _is_internal_dimension(d: Dict[str, Any]) -> bool:
             element = str(d.get("element") or "").lower()
             location = str(d.get("location") or "").lower()
             text = str(d.get("text") or "").lower()
             combined = f"{element} {location} {text}"
-            internal_markers = ["פנימי", "internal", "net", "נטו"]
-            return any(k in combined for k in internal_markers) and not _is_overall_dimension(d)
+            has_internal_marker = (
+                "פנימי" in combined or "internal" in combined or "net" in combined or "נטו" in combined
+            )
+            return has_internal_marker and not _is_overall_dimension(d)
 
         for d in dims:
             if not isinstance(d, dict):
@@ -1799,7 +1929,7 @@ class MamadValidator:
             value_str = str(value_source or "").lower()
             if ("mm" in value_str) or ("מ\"מ" in value_str) or ("מ״מ" in value_str):
                 try:
-                    raw_num = float(re.search(r"\d+\.?\d*", value_str).group())
+                    raw_num = float(_DIMENSION_NUMBER_RE.search(value_str).group())
                     val_m = raw_num / 1000.0
                 except Exception:
                     pass
@@ -1852,7 +1982,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "2.3",
                 "passed",
-                evidence=evidence + [self._evidence_dimension(value=area_m2, unit="m2", element="computed_area")],
+                evidence=chain(evidence, [self._evidence_dimension(value=area_m2, unit="m2", element="computed_area")]),
                 notes_he=f"שטח ממ\"ד מחושב {area_m2:.2f} מ\"ר ועומד בדרישת המינימום (≥9 מ\"ר).",
             )
             return True
@@ -1860,7 +1990,7 @@ class MamadValidator:
         self._add_requirement_evaluation(
             "2.3",
             "failed",
-            evidence=evidence + [self._evidence_dimension(value=area_m2, unit="m2", element="computed_area")],
+            evidence=chain(evidence, [self._evidence_dimension(value=area_m2, unit="m2", element="computed_area")]),
             notes_he=f"שטח ממ\"ד מחושב {area_m2:.2f} מ\"ר, קטן מהמינימום הנדרש (9 מ\"ר).",
         )
         return True
@@ -1910,13 +2040,11 @@ class MamadValidator:
         Validation (only if the plan is attempting to classify it as NOT external):
         - A protective reinforced concrete wall (>=20cm) must exist.
         """
-        text_items = data.get("text_items") or []
-        annotations = data.get("annotations") or []
-        all_text = " ".join([str(t.get("text", "")) for t in (text_items + annotations) if isinstance(t, dict)]).lower()
+        all_text = self._segment_feature(data, "notes_text_lower", lambda: self._notes_text_lower(data))
 
         near_exterior = bool(
             ("קו" in all_text and ("חיצונ" in all_text or "בנין" in all_text))
-            and re.search(r"(?<!\d)2\s*(?:m|מ')\b", all_text)
+            and _NEAR_EXTERIOR_2M_RE.search(all_text)
         )
         if not near_exterior:
             self._add_requirement_evaluation(
@@ -1939,7 +2067,7 @@ class MamadValidator:
         )
 
         protective_wall = ("קיר מגן" in all_text or "protective wall" in all_text) and bool(
-            re.search(r"(?<!\d)20\s*(?:cm|ס\"מ)\b", all_text)
+            _PROTECTIVE_WALL_20CM_RE.search(all_text)
         )
 
         evidence = []
@@ -1963,7 +2091,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "1.3",
                 "passed",
-                evidence=evidence + [self._evidence_dimension(value=20.0, unit="cm", element="required_protective_wall_thickness")],
+                evidence=chain(evidence, [self._evidence_dimension(value=20.0, unit="cm", element="required_protective_wall_thickness")]),
                 notes_he="החריג 1.3 נתמך: קיימת אינדיקציה לקיר <2 מ' מהקו החיצוני ובמקביל קיים קיר מגן מבטון בעובי ≥20 ס\"מ.",
             )
             return True
@@ -1971,7 +2099,7 @@ class MamadValidator:
         self._add_requirement_evaluation(
             "1.3",
             "failed",
-            evidence=evidence + [self._evidence_dimension(value=20.0, unit="cm", element="required_protective_wall_thickness")],
+            evidence=chain(evidence, [self._evidence_dimension(value=20.0, unit="cm", element="required_protective_wall_thickness")]),
             notes_he="החריג 1.3 אינו מתקיים: קיימת אינדיקציה לקיר <2 מ' מהקו החיצוני וכן ניסיון להתייחס אליו כלא-חיצוני, אך לא נמצאה ראיה לקיר מגן מבטון בעובי ≥20 ס\"מ.",
         )
         return True
@@ -2002,19 +2130,18 @@ class MamadValidator:
         for d in dims:
             if not isinstance(d, dict):
                 continue
-            unit = str(d.get("unit") or "").lower().strip()
-            if unit not in {"m", "meter", "meters"}:
-                continue
-            v = self._extract_dimension_value(d.get("value"), "m")
-            if v is None:
+            # Cheap rejects first: unit, then wording, and only then parse the value.
+            unit = d.get("unit")
+            if not isinstance(unit, str) or unit.lower().strip() not in _METER_UNITS:
                 continue
-            element = str(d.get("element") or "").lower()
-            loc = str(d.get("location") or "").lower()
             # Prefer explicit wall-height / concrete-to-concrete wording.
-            if any(k in element or k in loc for k in ["בטון", "beton", "concrete", "קיר", "wall", "בטון-לבטון", "clear", "מפתח"]):
-                if best_value is None or v > best_value:
-                    best_value = v
-                    best = d
+            element_and_loc = f"{str(d.get('element') or '')} {str(d.get('location') or '')}".lower()
+            if not _HIGH_WALL_KEYS_RE.search(element_and_loc):
+                continue
+            v = self._extract_dimension_value(d.get("value"), "m")
+            if v is not None and (best_value is None or v > best_value):
+                best_value = v
+                best = d
 
         if best_value is None:
             self._add_requirement_evaluation(
@@ -2072,9 +2199,7 @@ class MamadValidator:
         Validation:
         - Continuity must be >=70%. If <70%, it indicates a required alternative design path.
         """
-        text_items = data.get("text_items") or []
-        annotations = data.get("annotations") or []
-        all_text = " ".join([str(t.get("text", "")) for t in (text_items + annotations) if isinstance(t, dict)]).lower()
+        all_text = self._segment_feature(data, "notes_text_lower", lambda: self._notes_text_lower(data))
 
         tower_markers = [
             "מגדל ממ\"דים",
@@ -2094,10 +2219,10 @@ class MamadValidator:
             return False
 
         # Parse continuity percentage if explicitly provided.
-        m = re.search(r"(?i)(?:רציפות|continuity)\s*[:=]?\s*(\d{1,3}(?:\.\d+)?)\s*%", all_text)
+        m = _CONTINUITY_PCT_RE.search(all_text)
         if not m:
             # Fallback: explicit mention of 70% near continuity.
-            m = re.search(r"(?i)(?:רציפות|continuity)[^\n%]{0,40}(\d{1,3}(?:\.\d+)?)\s*%", all_text)
+            m = _CONTINUITY_PCT_NEAR_RE.search(all_text)
 
         if not m:
             self._add_requirement_evaluation(
@@ -2152,7 +2277,7 @@ class MamadValidator:
         - Distance from door edge to perpendicular wall outside: ≥ 75cm
         """
         elements = data.get("structural_elements", [])
-        doors = [e for e in elements if e.get("type") in ["door", "דלת", "דלת הדף"]]
+        doors = [e for e in elements if e.get("type") in _DOOR_TYPES]
         
         if not doors:
             # Not necessarily an error - segment might not show door
@@ -2166,84 +2291,103 @@ class MamadValidator:
 
         checked_any = False
         evidence: List[Dict[str, Any]] = []
-        
-        # Check door spacing (simplified - would need spatial analysis)
-        for door in doors:
-            dimensions_str = door.get("dimensions", "")
-
-            classification = data.get("classification", {})
-            primary_category_raw = classification.get("primary_category", "")
-            primary_category = ""
-            if isinstance(primary_category_raw, str) and primary_category_raw.strip():
-                primary_category = re.split(r"[|,]", primary_category_raw.strip())[0].strip().upper()
-            elif isinstance(primary_category_raw, list) and primary_category_raw:
-                primary_category = str(primary_category_raw[0]).strip().upper()
-            
-            # Look for spacing annotations in text_items
-            text_items = data.get("text_items", [])
-            door_markers = [
-                "door", "jamb", "frame", 
-                "דלת", "משקוף",
-            ]
 
-            def _mentions_door(s: str) -> bool:
-                s = (s or "").lower()
-                return any(m in s for m in door_markers)
+        classification = data.get("classification", {})
+        primary_category = _primary_category(classification)
 
-            spacing_texts = [
-                t for t in text_items
-                if (
-                    ("מרחק" in (t.get("text", "") or ""))
-                    or ("ס\"מ" in (t.get("text", "") or ""))
-                    or ("cm" in (t.get("text", "") or "").lower())
-                )
-                and _mentions_door(str(t.get("text", "")))
-            ]
+        def _as_number(v: Any) -> Optional[float]:
+            try:
+                if v is None:
+                    return None
+                return float(v)
+            except Exception:
+                return None
 
-            # Also look for spacing in extracted dimensions/door fields (more reliable than raw text)
-            extracted_dims = data.get("dimensions", [])
-            spacing_dims = []
-            for d in extracted_dims:
-                element = str(d.get("element", ""))
-                location = str(d.get("location", ""))
-                joined = f"{element} {location}"
+        def _as_cm(value: Any, unit: Any) -> Optional[float]:
+            num = _as_number(value)
+            # Default to cm if unit is missing/unknown; only m/mm need scaling.
+            if num is None or not unit:
+                return num
+            factors = _UNIT_TO_CM.get(str(unit).strip().lower())
+            if factors is None:
+                return num
+            return num * factors[0] / factors[1]
 
-                # Accept generic "distance/מרחק" only if the dimension is explicitly tied to a door/frame/opening.
-                if not _mentions_door(joined):
-                    continue
+        
+        # Spacing annotations and dimensions are matched on door wording, not on a particular
+        # door, so collect them once and share them across doors.
+        text_items = data.get("text_items", [])
+        spacing_texts = []
+        for t in text_items:
+            text = t.get("text", "") or ""
+            text_lower = text.lower()
+            if (
+                ("מרחק" in text or "ס\"מ" in text or "cm" in text_lower)
+                and _DOOR_MARKER_RE.search(text_lower)
+            ):
+                spacing_texts.append(t)
+
+        # Also look for spacing in extracted dimensions/door fields (more reliable than raw text)
+        extracted_dims = data.get("dimensions", [])
+        spacing_dims = []
+        for d in extracted_dims:
+            el_lower = str(d.get("element", "")).lower()
+            loc_lower = str(d.get("location", "")).lower()
+
+            # Accept generic "distance/מרחק" only if the dimension is explicitly tied to a door/frame/opening.
+            if not (_DOOR_MARKER_RE.search(el_lower) or _DOOR_MARKER_RE.search(loc_lower)):
+                continue
 
-                el_lower = element.lower()
-                if any(k in el_lower for k in ["door", "jamb", "spacing", "clearance", "distance", "מרחק"]):
-                    spacing_dims.append(d)
+            if _DOOR_SPACING_ELEMENT_RE.search(el_lower):
+                spacing_dims.append((d, _as_cm(d.get("value"), d.get("unit"))))
+
+        # The 75/90 heuristic over spacing dimensions does not depend on the door, so decide it once.
+        # Filter out very small "offset" values (e.g., 20/25/40/45) that are commonly wall
+        # thicknesses or local offsets near the door, not the required clearances.
+        spacing_values_cm = [v_cm for _, v_cm in spacing_dims if v_cm is not None and v_cm >= 60.0]
+        # If all observed door-adjacent spacings are >= 75cm and at least one is >= 90cm,
+        # treat as compliant (likely covers external>=75 and internal>=90).
+        all_ge_75 = True
+        any_ge_90 = False
+        for v_cm in spacing_values_cm:
+            if v_cm < 75.0:
+                all_ge_75 = False
+                break
+            if v_cm >= 90.0:
+                any_ge_90 = True
+        spacing_values_compliant = all_ge_75 and any_ge_90
+        # Only the evidence location depends on the door; read the other fields once.
+        spacing_evidence_fields = [
+            (d, v_cm, str(d.get("element") or "door_spacing"), d.get("location"), str(d.get("value") or ""))
+            for d, v_cm in spacing_dims
+            if v_cm is not None
+        ]
+        # Build a short preview for logs only
+        found_preview: list[str] = []
+        for d, v_cm in spacing_dims:
+            if len(found_preview) >= 4:
+                break
+            elem = d.get("element")
+            try:
+                if v_cm is not None:
+                    found_preview.append(f"{elem or 'door'}: {v_cm:.0f} cm")
+                else:
+                    found_preview.append(f"{elem or 'door'}: {d.get('value')} {d.get('unit') or ''}")
+            except Exception:
+                pass
+
+        # Check door spacing (simplified - would need spatial analysis)
+        for door in doors:
+            door_loc = str(door.get("location") or "")
 
             door_internal = door.get("spacing_internal_cm") or door.get("door_spacing_internal_cm")
             door_external = door.get("spacing_external_cm") or door.get("door_spacing_external_cm")
             door_confidence = door.get("spacing_confidence") or door.get("door_spacing_confidence")
 
-            def _as_number(v: Any) -> Optional[float]:
-                try:
-                    if v is None:
-                        return None
-                    return float(v)
-                except Exception:
-                    return None
-
             internal_cm = _as_number(door_internal)
             external_cm = _as_number(door_external)
             confidence = _as_number(door_confidence)
 
-            def _as_cm(value: Any, unit: Any) -> Optional[float]:
-                num = _as_number(value)
-                if num is None:
-                    return None
-                u = (str(unit or "").strip().lower() or "cm")
-                if u in {"m", "meter", "meters", "מ", "מטר"}:
-                    return num * 100.0
-                if u in {"mm", "millimeter", "millimeters", "מ\"מ", "ממ"}:
-                    return num / 10.0
-                # Default to cm if unit is missing/unknown
-                return num
-
             # If the model provided explicit internal/external values, evaluate them.
             if internal_cm is not None or external_cm is not None:
                 # If the focused extractor provided a low confidence, prefer not_checked over
@@ -2258,14 +2402,14 @@ class MamadValidator:
                                 value=internal_cm,
                                 unit="cm",
                                 element="door_spacing_internal",
-                                location=str(door.get("location") or ""),
+                                location=door_loc,
                                 raw=door,
                             ),
                             self._evidence_dimension(
                                 value=external_cm,
                                 unit="cm",
                                 element="door_spacing_external",
-                                location=str(door.get("location") or ""),
+                                location=door_loc,
                                 raw=door,
                             ),
                         ],
@@ -2275,9 +2419,9 @@ class MamadValidator:
 
                 checked_any = True
                 if internal_cm is not None:
-                    evidence.append(self._evidence_dimension(value=internal_cm, unit="cm", element="door_spacing_internal", location=door.get("location", ""), raw=door))
+                    evidence.append(self._evidence_dimension(value=internal_cm, unit="cm", element="door_spacing_internal", location=door_loc, raw=door))
                 if external_cm is not None:
-                    evidence.append(self._evidence_dimension(value=external_cm, unit="cm", element="door_spacing_external", location=door.get("location", ""), raw=door))
+                    evidence.append(self._evidence_dimension(value=external_cm, unit="cm", element="door_spacing_external", location=door_loc, raw=door))
 
                 # For a reliable PASS we require BOTH internal and external clearances.
                 if internal_cm is None or external_cm is None:
@@ -2297,20 +2441,14 @@ class MamadValidator:
                     self._add_requirement_evaluation(
                         "3.1",
                         "passed",
-                        evidence=evidence + [
-                            self._evidence_dimension(value=90.0, unit="cm", element="required_internal_min"),
-                            self._evidence_dimension(value=75.0, unit="cm", element="required_external_min"),
-                        ],
+                        evidence=chain(evidence, self._door_required_evidence),
                         notes_he="ריווחי הדלת עומדים בדרישות (≥90 ס\"מ פנימי, ≥75 ס\"מ חיצוני).",
                     )
                 else:
                     self._add_requirement_evaluation(
                         "3.1",
                         "failed",
-                        evidence=evidence + [
-                            self._evidence_dimension(value=90.0, unit="cm", element="required_internal_min"),
-                            self._evidence_dimension(value=75.0, unit="cm", element="required_external_min"),
-                        ],
+                        evidence=chain(evidence, self._door_required_evidence),
                         notes_he="נמצאו ריווחי דלת שאינם עומדים בדרישות.",
                     )
                 continue
@@ -2319,56 +2457,25 @@ class MamadValidator:
             # For demo/real-world plans, we prefer to avoid false negatives when the drawing
             # provides dimensions but doesn't label them as "internal/external" explicitly.
             if spacing_dims: 
-                spacing_values_cm: list[float] = []
-                found_preview: list[str] = []
-                for d in spacing_dims:
-                    v_cm = _as_cm(d.get("value"), d.get("unit"))
-                    if v_cm is not None:
-                        # Filter out very small "offset" values (e.g., 20/25/40/45) that are commonly
-                        # wall thicknesses or local offsets near the door, not the required clearances.
-                        # We only evaluate plausible clearance candidates.
-                        if v_cm >= 60.0:
-                            spacing_values_cm.append(v_cm)
-
-                    if v_cm is not None:
-                        evidence.append(
-                            self._evidence_dimension(
-                                value=v_cm,
-                                unit="cm",
-                                element=str(d.get("element") or "door_spacing"),
-                                location=str(d.get("location") or door.get("location", "")),
-                                text=str(d.get("value") or ""),
-                                raw=d,
-                            )
+                for d, v_cm, element, location, text in spacing_evidence_fields:
+                    evidence.append(
+                        self._evidence_dimension(
+                            value=v_cm,
+                            unit="cm",
+                            element=element,
+                            location=str(location or door_loc),
+                            text=text,
+                            raw=d,
                         )
-
-                    # Build a short preview for logs only
-                    if len(found_preview) < 4:
-                        elem = d.get("element") or "door"
-                        try:
-                            if v_cm is not None:
-                                found_preview.append(f"{elem}: {v_cm:.0f} cm")
-                            else:
-                                found_preview.append(f"{elem}: {d.get('value')} {d.get('unit') or ''}")
-                        except Exception:
-                            pass
+                    )
 
                 if spacing_values_cm:
-                    max_cm = max(spacing_values_cm)
-                    min_cm = min(spacing_values_cm)
-
-                    # Heuristic:
-                    # - If all observed door-adjacent spacings are >= 75cm and at least one is >= 90cm,
-                    #   treat as compliant (likely covers external>=75 and internal>=90).
-                    if min_cm >= 75.0 and max_cm >= 90.0: 
+                    if spacing_values_compliant:
                         checked_any = True
                         self._add_requirement_evaluation(
                             "3.1",
                             "passed",
-                            evidence=evidence + [
-                                self._evidence_dimension(value=90.0, unit="cm", element="required_internal_min"),
-                                self._evidence_dimension(value=75.0, unit="cm", element="required_external_min"),
-                            ],
+                            evidence=chain(evidence, self._door_required_evidence),
                             notes_he="נמצאו מידות סמוכות לדלת שמספיקות כדי לעמוד בספי 75/90 ס\"מ.",
                         )
                         continue
@@ -2378,7 +2485,7 @@ class MamadValidator:
                     logger.info(
                         "Door spacing evidence found but ambiguous; not emitting violation",
                         found_preview=found_preview,
-                        location=door.get("location", "")
+                        location=door_loc
                     )
                     self._add_requirement_evaluation(
                         "3.1",
@@ -2392,7 +2499,7 @@ class MamadValidator:
                 # spacing_dims exist but without numeric values; not enough to validate.
                 logger.info(
                     "Door spacing evidence found (non-numeric); not emitting violation",
-                    location=door.get("location", "")
+                    location=door_loc
                 )
                 self._add_requirement_evaluation(
                     "3.1",
@@ -2411,7 +2518,7 @@ class MamadValidator:
                     logger.info(
                         "Skipping DOOR_001 missing-spacing warning for non-door-detail segment",
                         primary_category=primary_category,
-                        location=door.get("location", "")
+                        location=door_loc
                     )
                     # Still emit an explicit not_checked evaluation for transparency.
                     self._add_requirement_evaluation(
@@ -2422,7 +2529,7 @@ class MamadValidator:
                             self._evidence_text(
                                 text="לא נמצאו מידות ריווח דלת לקיר ניצב (פנימי/חיצוני) שנדרשות ל-3.1",
                                 element="door_spacing",
-                                location=str(door.get("location") or ""),
+                                location=door_loc,
                                 raw=door,
                             )
                         ],
@@ -2450,7 +2557,7 @@ class MamadValidator:
         - Distance from window to perpendicular wall: ≥ 20cm
         """
         elements = data.get("structural_elements", [])
-        windows = [e for e in elements if e.get("type") in ["window", "חלון", "חלון הדף"]]
+        windows = [e for e in elements if e.get("type") in _WINDOW_TYPES]
         
         if not windows:
             self._add_requirement_evaluation(
@@ -2492,7 +2599,7 @@ class MamadValidator:
                     continue
 
                 conf = _as_number(w.get("confidence"))
-                location = str(w.get("location") or "")
+                location = _as_text(w.get("location"))
                 ev_list = w.get("evidence")
                 if isinstance(ev_list, list):
                     for ev in ev_list[:8]:
@@ -2568,12 +2675,7 @@ class MamadValidator:
                     self._add_requirement_evaluation(
                         "3.2",
                         "failed",
-                        evidence=evidence
-                        + [
-                            self._evidence_dimension(value=20.0, unit="cm", element="required_min_niche_or_wall"),
-                            self._evidence_dimension(value=100.0, unit="cm", element="required_min_light_openings"),
-                            self._evidence_dimension(value=20.0, unit="cm", element="required_min_window_to_wall"),
-                        ],
+                        evidence=chain(evidence, self._window_required_evidence),
                         notes_he="נמצאו מרחקים/נישות לחלון הדף שאינם עומדים בדרישות סעיף 3.2.",
                     )
                     return True
@@ -2594,12 +2696,7 @@ class MamadValidator:
                     self._add_requirement_evaluation(
                         "3.2",
                         "passed",
-                        evidence=evidence
-                        + [
-                            self._evidence_dimension(value=20.0, unit="cm", element="required_min_niche_or_wall"),
-                            self._evidence_dimension(value=100.0, unit="cm", element="required_min_light_openings"),
-                            self._evidence_dimension(value=20.0, unit="cm", element="required_min_window_to_wall"),
-                        ],
+                        evidence=chain(evidence, self._window_required_evidence),
                         notes_he="כל תתי-הבדיקות הרלוונטיות של 3.2 שניתן היה לאמת בסגמנט זה עומדות בדרישות (כלל מותנה לפי מצב תכנוני).",
                     )
                 return True
@@ -2608,41 +2705,70 @@ class MamadValidator:
             # Keep the evidence and continue to the legacy text-based fallback.
             focus_inconclusive_evidence = evidence
 
+        # Look for spacing annotations. They are not tied to a specific window, so scan the
+        # text items once and reuse the first match for every window.
+        spacing_text: Optional[str] = None
+        spacing_item: Optional[Dict[str, Any]] = None
+        for t in data.get("text_items", []):
+            txt = _as_text(t.get("text"))
+            if not txt:
+                continue
+            # Require explicit mention of window/opening context
+            if ("חלון" not in txt) and ("window" not in txt.lower()):
+                continue
+            # Require explicit unit to avoid matching substrings like "200" -> "20"
+            if _WIN_SPACING_RE.search(txt.translate(_HEBREW_QUOTES_TO_ASCII)):
+                spacing_text = txt
+                spacing_item = t
+                break
+
+        # Include a small subset of focus evidence to explain why the structured path
+        # couldn't be used (e.g., low confidence / capacity). Shared by every window.
+        focus_evidence_subset = focus_inconclusive_evidence[:10]
+
+        # Structured focus was inconclusive and the text offers no spacing callout, so every
+        # window would get the same not_checked verdict; emit it once for the whole segment.
+        if (
+            spacing_text is None
+            and focus_inconclusive_evidence
+            and len(windows) > _WINDOW_SPACING_MAX_PER_WINDOW_EVALUATIONS
+            and not focus_unavailable
+        ):
+            windows_evidence = [self._evidence_text(text=f"זוהו {len(windows)} חלונות בסגמנט", element="window")]
+            windows_evidence.extend(
+                self._evidence_text(
+                    text="חלון זוהה בסגמנט",
+                    element="window",
+                    location=_as_text(window.get("location")),
+                    raw=window,
+                )
+                for window in windows
+            )
+            self._add_requirement_evaluation(
+                "3.2",
+                "not_checked",
+                reason_not_checked="low_confidence_or_no_numeric_window_spacing",
+                evidence=chain(windows_evidence, focus_evidence_subset),
+                notes_he="החילוץ הממוקד לריווח חלון לא סיפק ערכים מספריים ברמת ביטחון מספקת, וגם לא נמצאו מידות ריווח מפורשות בסגמנט.",
+            )
+            return False
+
         # Check spacing (simplified)
         for window in windows:
             window_evidence: List[Dict[str, Any]] = [
                 self._evidence_text(
                     text="חלון זוהה בסגמנט",
                     element="window",
-                    location=str(window.get("location") or ""),
+                    location=_as_text(window.get("location")),
                     raw=window,
                 )
             ]
 
-            if focus_inconclusive_evidence:
-                # Include a small subset of focus evidence to explain why the
-                # structured path couldn't be used (e.g., low confidence / capacity).
-                window_evidence.extend(focus_inconclusive_evidence[:10])
-            # Look for spacing annotations
-            text_items = data.get("text_items", [])
-            spacing_found = False
-            for t in text_items:
-                txt = str(t.get("text", "") or "")
-                if not txt:
-                    continue
-                txt_lower = txt.lower()
-                # Require explicit mention of window/opening context
-                if ("חלון" not in txt) and ("window" not in txt_lower):
-                    continue
-                # Require explicit unit to avoid matching substrings like "200" -> "20"
-                if re.search(r"(?<!\d)20(?:\.0)?\s*(?:cm|ס\"מ)\b", txt, flags=re.IGNORECASE):
-                    spacing_found = True
-                    window_evidence.append(self._evidence_text(text=txt, element="window_spacing", raw=t))
-                    break
-                if re.search(r"(?<!\d)100(?:\.0)?\s*(?:cm|ס\"מ)\b", txt, flags=re.IGNORECASE):
-                    spacing_found = True
-                    window_evidence.append(self._evidence_text(text=txt, element="window_spacing", raw=t))
-                    break
+            if focus_evidence_subset:
+                window_evidence.extend(focus_evidence_subset)
+            spacing_found = spacing_text is not None
+            if spacing_found:
+                window_evidence.append(self._evidence_text(text=spacing_text, element="window_spacing", raw=spacing_item))
             
             if spacing_found:
                 checked_any = True
@@ -2696,18 +2822,18 @@ class MamadValidator:
         internal_ok = True
         external_values: List[float] = []
         internal_values: List[float] = []
+        violation_count = 0
 
-        for rebar in rebar_details:
-            if not isinstance(rebar, dict):
+        for rebar in [r for r in rebar_details if isinstance(r, dict)]:
+            spacing_str = _as_text(rebar.get("spacing"))
+            if not spacing_str:
                 continue
-            spacing_str = rebar.get("spacing", "")
-            spacing_cm = self._extract_dimension_value(str(spacing_str or ""), "cm")
-            location = str(rebar.get("location", "") or "")
-            location_lower = location.lower()
-
+            spacing_cm = self._extract_dimension_value(spacing_str, "cm")
             if spacing_cm is None:
                 continue
 
+            location = _as_text(rebar.get("location"))
+
             has_any_numeric = True
             evidence.append(
                 self._evidence_dimension(
@@ -2715,24 +2841,34 @@ class MamadValidator:
                     unit="cm",
                     element="rebar_spacing",
                     location=location,
-                    text=str(spacing_str or ""),
+                    text=spacing_str,
                     raw=rebar,
                 )
             )
 
-            is_external = ("חיצוני" in location) or ("external" in location_lower)
-            is_internal = ("פנימי" in location) or ("internal" in location_lower)
+            is_external = _REBAR_EXTERNAL_RE.search(location) is not None
+            is_internal = _REBAR_INTERNAL_RE.search(location) is not None
 
+            violates = False
             if is_external:
                 has_external = True
                 external_values.append(spacing_cm)
                 if spacing_cm > 20.0:
                     external_ok = False
+                    violates = True
             if is_internal:
                 has_internal = True
                 internal_values.append(spacing_cm)
                 if spacing_cm > 10.0:
                     internal_ok = False
+                    violates = True
+
+            # Any violation already decides "failed"; keep one more violating entry as
+            # context and skip parsing the rest of the rebar list.
+            if violates:
+                violation_count += 1
+                if violation_count >= 2:
+                    break
 
         if not has_any_numeric:
             self._add_requirement_evaluation(
@@ -2749,11 +2885,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "6.3",
                 "failed",
-                evidence=evidence
-                + [
-                    self._evidence_dimension(value=20.0, unit="cm", element="required_external_max"),
-                    self._evidence_dimension(value=10.0, unit="cm", element="required_internal_max"),
-                ],
+                evidence=chain(evidence, self._rebar_required_evidence),
                 notes_he="נמצאה פסיעת זיון שעולה על הערכים המותרים (חיצוני≤20, פנימי≤10 ס\"מ).",
             )
             return True
@@ -2763,11 +2895,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "6.3",
                 "passed",
-                evidence=evidence
-                + [
-                    self._evidence_dimension(value=20.0, unit="cm", element="required_external_max"),
-                    self._evidence_dimension(value=10.0, unit="cm", element="required_internal_max"),
-                ],
+                evidence=chain(evidence, self._rebar_required_evidence),
                 notes_he="פסיעות הזיון שנמצאו עומדות בדרישות (חיצוני≤20, פנימי≤10 ס\"מ).",
             )
             return True
@@ -2776,11 +2904,7 @@ class MamadValidator:
             "6.3",
             "not_checked",
             reason_not_checked="partial_rebar_context",
-            evidence=evidence
-            + [
-                self._evidence_dimension(value=20.0, unit="cm", element="required_external_max"),
-                self._evidence_dimension(value=10.0, unit="cm", element="required_internal_max"),
-            ],
+            evidence=chain(evidence, self._rebar_required_evidence),
             notes_he="נמצאו פסיעות זיון אך חסר הקשר ברור האם מדובר גם בזיון פנימי וגם בזיון חיצוני; לא בוצעה הכרעה מלאה.",
         )
         return False
@@ -2799,15 +2923,7 @@ class MamadValidator:
             )
             return False
 
-        concrete_materials = [
-            m
-            for m in materials
-            if isinstance(m, dict)
-            and (
-                "בטון" in str(m.get("type", "")).lower()
-                or "concrete" in str(m.get("type", "")).lower()
-            )
-        ]
+        concrete_materials = _materials_of_kind(materials, _CONCRETE_TYPE_MARKERS)
         if not concrete_materials:
             self._add_requirement_evaluation(
                 "6.1",
@@ -2820,12 +2936,12 @@ class MamadValidator:
         evidence: List[Dict[str, Any]] = []
         parsed_grades: List[int] = []
         for concrete in concrete_materials:
-            grade_raw = str(concrete.get("grade", "") or "")
-            notes = str(concrete.get("notes", "") or "")
+            grade_raw = _as_text(concrete.get("grade"))
+            notes = _as_text(concrete.get("notes"))
             combined = f"{grade_raw} {notes}".strip()
             evidence.append(self._evidence_text(text=combined or "בטון", element="concrete_grade", raw=concrete))
 
-            m = re.search(r"(?:b|ב)\s*[-]?\s*(\d+)", combined, flags=re.IGNORECASE)
+            m = _CONCRETE_GRADE_RE.search(combined)
             if m:
                 try:
                     parsed_grades.append(int(m.group(1)))
@@ -2847,7 +2963,7 @@ class MamadValidator:
             self._add_requirement_evaluation(
                 "6.1",
                 "failed",
-                evidence=evidence + [self._evidence_text(text="נדרש B-30 לפחות", element="required_concrete_grade")],
+                evidence=chain(evidence, [self._evidence_text(text="נדרש B-30 לפחות", element="required_concrete_grade")]),
                 notes_he=f"נמצאה דרגת בטון B-{min_grade} נמוכה מהמינימום B-30.",
             )
             return True
@@ -2855,7 +2971,7 @@ class MamadValidator:
         self._add_requirement_evaluation(
             "6.1",
             "passed",
-            evidence=evidence + [self._evidence_text(text="נדרש B-30 לפחות", element="required_concrete_grade")],
+            evidence=chain(evidence, [self._evidence_text(text="נדרש B-30 לפחות", element="required_concrete_grade")]),
             notes_he=f"דרגת הבטון שפוענחה (מינימום B-{min_grade}) עומדת בדרישה B-30 לפחות.",
         )
         return True
@@ -2874,15 +2990,7 @@ class MamadValidator:
             )
             return False
 
-        steel_materials = [
-            m
-            for m in materials
-            if isinstance(m, dict)
-            and (
-                "פלדה" in str(m.get("type", "")).lower()
-                or "steel" in str(m.get("type", "")).lower()
-            )
-        ]
+        steel_materials = _materials_of_kind(materials, _STEEL_TYPE_MARKERS)
 
         if not steel_materials:
             self._add_requirement_evaluation(
@@ -2898,15 +3006,16 @@ class MamadValidator:
         found_allowed = False
 
         for steel in steel_materials:
-            grade = str(steel.get("grade", "") or "")
-            notes = str(steel.get("notes", "") or "")
+            grade = _as_text(steel.get("grade"))
+            notes = _as_text(steel.get("notes"))
             spec = f"{grade} {notes}".strip()
             evidence.append(self._evidence_text(text=spec or "פלדה", element="steel_spec", raw=steel))
 
-            spec_lower = spec.lower()
-            if ("משוכה בקור" in spec) or ("cold-drawn" in spec_lower) or ("cold drawn" in spec_lower):
+            # Cold-drawn steel alone decides "failed"; the evidence gathered so far ends with it.
+            if _STEEL_COLD_DRAWN_RE.search(spec):
                 found_cold_drawn = True
-            if ("מעוגלת בחום" in spec) or ("רתיך" in spec) or ("hot-rolled" in spec_lower) or ("hot rolled" in spec_lower) or ("welded" in spec_lower):
+                break
+            if not found_allowed and _STEEL_ALLOWED_RE.search(spec):
                 found_allowed = True
 
         if found_cold_drawn:
@@ -2940,11 +3049,9 @@ class MamadValidator:
         """
         Rule 4.2: Must include note about TI 4570 ventilation standard
         """
-        text_items = data.get("text_items", [])
-        annotations = data.get("annotations", [])
-        all_text = " ".join([str(t.get("text", "") or "") for t in (text_items + annotations) if isinstance(t, dict)])
+        all_text = self._segment_feature(data, "notes_text", lambda: self._notes_text(data))
 
-        if not all_text.strip():
+        if not all_text or all_text.isspace():
             self._add_requirement_evaluation(
                 "4.2",
                 "not_checked",
@@ -2953,8 +3060,8 @@ class MamadValidator:
             )
             return False
 
-        # Check for TI 4570 reference
-        if ("4570" in all_text) or ("ת\"י 4570" in all_text) or ("ת״י 4570" in all_text):
+        # Check for TI 4570 reference (every "ת\"י 4570" spelling contains the bare number)
+        if "4570" in all_text:
             self._add_requirement_evaluation(
                 "4.2",
                 "passed",
@@ -2975,6 +3082,20 @@ class MamadValidator:
     # Helper Methods
     # =========================================================================
     
+    def _notes_text(self, data: Dict[str, Any]) -> str:
+        """Join of all text items + annotations (used by the 1.2/2.3/4.2 rules)."""
+        text_items = data.get("text_items") or []
+        annotations = data.get("annotations") or []
+        joined = " ".join(str(t.get("text") or "") for t in chain(text_items, annotations) if isinstance(t, dict))
+        return joined.translate(_HEBREW_QUOTES_TO_ASCII)
+
+    def _notes_text_lower(self, data: Dict[str, Any]) -> str:
+        """Lower-cased join of all text items + annotations (used by the 1.3/1.5 rules)."""
+        text_items = data.get("text_items") or []
+        annotations = data.get("annotations") or []
+        joined = " ".join([str(t.get("text", "")) for t in chain(text_items, annotations) if isinstance(t, dict)])
+        return joined.lower().translate(_HEBREW_QUOTES_TO_ASCII)
+
     def _extract_dimension_value(self, value_str: str, unit: str) -> Optional[float]:
         """
         Extract numeric value from dimension string.
@@ -2987,22 +3108,24 @@ class MamadValidator:
         if not value_str:
             return None
         
-        # Convert to string if it's a number
-        if isinstance(value_str, (int, float)):
-            value_str = str(value_str)
-        
-        import re
-        
-        # Remove common units
-        clean_str = value_str.replace("cm", "").replace("ס\"מ", "").replace("מ'", "")
-        clean_str = clean_str.replace("m", "").replace("mm", "").strip()
-        
-        # Extract number
-        match = re.search(r'\d+\.?\d*', clean_str)
-        if not match:
-            return None
-        
-        value = float(match.group())
+        if type(value_str) in (int, float) and 1e-4 <= value_str < 1e16:
+            # Already numeric, and in the range where str() has no sign/exponent, so the
+            # text parse below would recover exactly this value.
+            value = float(value_str)
+        else:
+            # Convert to string if it's a number
+            if isinstance(value_str, (int, float)):
+                value_str = str(value_str)
+
+            # Remove common units
+            clean_str = _DIMENSION_UNIT_RE.sub("", value_str).strip()
+
+            # Extract number
+            match = _DIMENSION_NUMBER_RE.search(clean_str)
+            if not match:
+                return None
+
+            value = float(match.group())
         
         # Convert to requested unit
         if unit == "cm":
@@ -3028,21 +3151,15 @@ class MamadValidator:
         - 3 external walls: 30cm
         - 4 external walls: 40cm
         """
-        if num_external_walls <= 2:
-            return 30 if has_window else 25
-        elif num_external_walls == 3:
-            return 30
-        else:  # 4 walls
-            return 40
+        return _REQUIRED_WALL_THICKNESS_CM[has_window][min(max(num_external_walls, 1), 4) - 1]
 
 
 # Singleton instance
-_validator_instance = None
+# Built at import time: construction is cheap, and concurrent first calls can never
+# race to create two instances.
+_validator_instance = MamadValidator()
 
 
 def get_mamad_validator() -> MamadValidator:
     """Get singleton validator instance"""
-    global _validator_instance
-    if _validator_instance is None:
-        _validator_instance = MamadValidator()
     return _validator_instance
@@ -1196,3 +1196,197 @@ def test_door_spacing_low_confidence_is_not_checked():
     evs = result.get("requirement_evaluations") or []
     ev_31 = [e for e in evs if e.get("requirement_id") == "3.1"]
     assert ev_31 and ev_31[-1].get("status") == "not_checked"
+
+
+def test_segment_feature_cache_is_not_reused_across_segments() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    tower = {
+        "classification": {"primary_category": "ROOM_LAYOUT"},
+        "text_items": [{"text": "מגדל ממ\"דים רציפות: 75%"}],
+        "annotations": [],
+        "dimensions": [],
+        "structural_elements": [],
+    }
+    no_tower = {**tower, "text_items": [{"text": "תכנית קומה"}]}
+
+    first = v.validate_segment(tower, demo_mode=True, enabled_requirements={"1.3", "1.5"})
+    second = v.validate_segment(no_tower, demo_mode=True, enabled_requirements={"1.3", "1.5"})
+
+    assert "1.5" in (first.get("checked_requirements") or [])
+    ev = next(e for e in second["requirement_evaluations"] if e.get("requirement_id") == "1.5")
+    assert ev.get("status") == "not_checked"
+    assert ev.get("reason_not_checked") == "not_applicable_no_tower_context"
+
+
+def test_rebar_spacing_fails_fast_with_violation_context() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "REBAR_DETAILS"},
+        "text_items": [],
+        "dimensions": [],
+        "structural_elements": [],
+        "rebar_details": [
+            {"spacing": "15cm", "location": "זיון חיצוני"},
+            {"spacing": "25cm", "location": "זיון חיצוני"},
+            {"spacing": "30cm", "location": "זיון חיצוני"},
+            {"spacing": "8cm", "location": "זיון פנימי"},
+        ],
+    }
+
+    result = v.validate_segment(analysis_data, enabled_requirements={"6.3"})
+    ev = next(e for e in result["requirement_evaluations"] if e.get("requirement_id") == "6.3")
+    assert ev.get("status") == "failed"
+    spacings = [item.get("value") for item in ev["evidence"] if item.get("element") == "rebar_spacing"]
+    # Entries after the second violation are not needed to decide the failure.
+    assert spacings == [15.0, 25.0, 30.0]
+    _assert_no_passed_or_failed_without_evidence(result["requirement_evaluations"])
+
+
+def test_window_spacing_inconclusive_focus_emits_single_evaluation_for_many_windows() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "WINDOW_DETAILS"},
+        "text_items": [],
+        "dimensions": [],
+        "annotations": [],
+        "structural_elements": [{"type": "window", "location": f"חלון {i}"} for i in range(5)],
+        "window_spacing_focus": {
+            "windows": [
+                {
+                    "niche_to_niche_cm": 25,
+                    "confidence": 0.3,
+                    "location": "חלון הדף",
+                    "evidence": ["25"],
+                }
+            ]
+        },
+    }
+
+    result = v.validate_segment(analysis_data, demo_mode=True, enabled_requirements={"3.2"})
+    evals = [e for e in result["requirement_evaluations"] if e.get("requirement_id") == "3.2"]
+    assert len(evals) == 1
+    assert evals[0].get("status") == "not_checked"
+    assert evals[0].get("reason_not_checked") == "low_confidence_or_no_numeric_window_spacing"
+    locations = [item.get("location") for item in evals[0]["evidence"] if item.get("element") == "window"]
+    assert [loc for loc in locations if loc] == [f"חלון {i}" for i in range(5)]
+    assert any(item.get("element") == "window_spacing_focus" for item in evals[0]["evidence"])
+
+
+def test_steel_type_stops_at_first_cold_drawn_material() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "MATERIALS_SPECS"},
+        "text_items": [],
+        "dimensions": [],
+        "structural_elements": [],
+        "materials": [
+            {"type": "פלדה", "grade": "מעוגלת בחום"},
+            {"type": "steel", "grade": "cold-drawn"},
+            {"type": "steel", "grade": "welded mesh"},
+        ],
+    }
+
+    result = v.validate_segment(analysis_data, enabled_requirements={"6.2"})
+    ev = next(e for e in result["requirement_evaluations"] if e.get("requirement_id") == "6.2")
+    assert ev.get("status") == "failed"
+    specs = [item.get("text") for item in ev["evidence"] if item.get("element") == "steel_spec"]
+    assert specs == ["מעוגלת בחום", "cold-drawn"]
+    _assert_no_passed_or_failed_without_evidence(result["requirement_evaluations"])
+
+
+def test_validate_segment_can_skip_legacy_violation_mirroring() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "REBAR_DETAILS"},
+        "text_items": [],
+        "dimensions": [],
+        "structural_elements": [],
+        "rebar_details": [{"spacing": "30cm", "location": "זיון חיצוני"}],
+    }
+
+    mirrored = v.validate_segment(analysis_data, enabled_requirements={"6.3"})
+    evidence_only = v.validate_segment(analysis_data, enabled_requirements={"6.3"}, emit_legacy_violations=False)
+
+    assert mirrored["violations"]
+    assert evidence_only["violations"] == []
+    assert evidence_only["total_violations"] == 0
+    assert evidence_only["status"] == mirrored["status"] == "failed"
+    assert evidence_only["critical_count"] == mirrored["critical_count"] == 1
+
+
+def test_segment_notes_normalize_hebrew_quote_marks() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    data = {
+        "text_items": [{"text": "קיר מגן 20 ס״מ"}],
+        "annotations": [{"text": "2 מ׳ מהקו החיצוני"}],
+    }
+
+    assert v._notes_text(data) == "קיר מגן 20 ס\"מ 2 מ' מהקו החיצוני"
+    assert v._notes_text_lower(data) == "קיר מגן 20 ס\"מ 2 מ' מהקו החיצוני"
+
+
+def test_door_spacing_gershayim_text_without_dimensions_is_not_checked() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "DOOR_DETAILS"},
+        "text_items": [{"text": "20 ס״מ דלת פתח"}],
+        "dimensions": [],
+        "structural_elements": [
+            {"type": "door", "location": "צפון"},
+            {"type": "door", "location": "דרום"},
+            {"type": "door", "location": "מזרח"},
+        ],
+    }
+
+    result = v.validate_segment(analysis_data, enabled_requirements={"3.1"})
+    evs = [e for e in result["requirement_evaluations"] if e.get("requirement_id") == "3.1"]
+    assert len(evs) == 3
+    assert all(e.get("status") == "not_checked" for e in evs)
+    assert all(e.get("reason_not_checked") == "no_spacing_evidence" for e in evs)
+    _assert_no_passed_or_failed_without_evidence(result["requirement_evaluations"])
+
+
+def test_validate_segment_releases_segment_feature_cache() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "GENERAL_NOTES"},
+        "text_items": [{"text": "ממ\"ד קנ\"מ 1:50 ת\"י 4570"}],
+        "dimensions": [],
+        "structural_elements": [],
+    }
+
+    v.validate_segment(analysis_data)
+    assert v._segment_cache == {}
+
+
+def test_room_height_exception_reads_volume_written_with_gershayim() -> None:
+    from src.services.mamad_validator import MamadValidator
+
+    v = MamadValidator()
+    analysis_data = {
+        "classification": {"primary_category": "SECTIONS"},
+        "text_items": [{"text": "ממ״ד במרתף"}, {"text": "נפח 25 מ״ק"}],
+        "dimensions": [{"value": "2.30", "unit": "m", "element": "גובה חדר", "location": "חתך"}],
+        "structural_elements": [],
+    }
+
+    result = v.validate_segment(analysis_data, enabled_requirements={"2.1", "2.2"})
+    statuses = {e["requirement_id"]: e["status"] for e in result["requirement_evaluations"]}
+    assert statuses == {"2.1": "passed", "2.2": "passed"}
+    assert result["critical_count"] == 0